@@ -4,15 +4,23 @@ This module provides the FastAPI service for document indexing and search
 using the refactored txtai-based RAG system.
 """
 
+import asyncio
+import base64
+import json
 import os
+import shutil
 import sys
 from contextlib import asynccontextmanager
-from typing import Optional, List
+from pathlib import Path
+from typing import Dict, Optional, List, Tuple
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
 from uvicorn import run
 
-sys.path.append(os.getcwd())
+# Ensure project root is in sys.path
+project_root = Path(__file__).resolve().parents[2]
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from core.logger import get_logger
 from config.config_loader import Config
@@ -51,6 +59,21 @@ async def lifespan(app: FastAPI):
             default="cpu",
             env_prefix="RAG",
         )
+        batch_size = config.get_with_env(
+            "rag.embedding.batch_size",
+            default=64,
+            env_prefix="RAG",
+        )
+        backend = config.get_with_env(
+            "rag.index.backend",
+            default="",
+            env_prefix="RAG",
+        )
+        quantize = config.get_with_env(
+            "rag.index.quantize",
+            default=0,
+            env_prefix="RAG",
+        )
         chunk_size = config.get_with_env(
             "rag.documents.chunk_size",
             default=500,
@@ -71,6 +94,9 @@ async def lifespan(app: FastAPI):
             model_path=model_path,
             index_path=index_path,
             device=device,
+            batch_size=batch_size,
+            backend=backend or None,
+            quantize=quantize or None,
             chunk_size=chunk_size,
             overlap=overlap,
             supported_formats=supported_formats,
@@ -368,6 +394,97 @@ async def get_file_tree(path: Optional[str] = None):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# File types searched by /files/search content matching
+_TEXT_EXTENSIONS = frozenset(
+    ['.txt', '.md', '.py', '.js', '.json', '.yaml', '.yml', '.html', '.css', '.sh', '.bash']
+)
+_RG_PATH = shutil.which("rg")
+
+
+def _match_preview(line: str, query: str) -> str:
+    """Cut a matching line to 300 chars on either side of the keyword."""
+    # Find keyword position for context extraction
+    keyword_pos = line.lower().find(query.lower())
+    line_stripped = line.strip()
+
+    # Extract context: 300 chars before + 300 chars after keyword
+    context_start = max(0, keyword_pos - 300)
+    context_end = min(len(line_stripped), keyword_pos + len(query) + 300)
+
+    # Add ellipsis if truncated
+    preview = line_stripped[context_start:context_end]
+    if context_start > 0:
+        preview = "..." + preview
+    if context_end < len(line_stripped):
+        preview = preview + "..."
+    return preview
+
+
+def _first_match(filepath: str, query_lower: str) -> Optional[Tuple[int, str]]:
+    """Return (line number, line) of the first case-insensitive match in a file."""
+    try:
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            for line_num, line in enumerate(f, 1):
+                if query_lower in line.lower():
+                    return line_num, line
+    except (PermissionError, UnicodeDecodeError):
+        pass
+    return None
+
+
+async def _rg_first_matches(query: str, directory: str) -> Optional[Dict[str, Tuple[int, str]]]:
+    """Find the first case-insensitive match in each text file using ripgrep.
+
+    Args:
+        query: Literal text to search for
+        directory: Absolute directory to search
+
+    Returns:
+        Mapping of file path to (line number, line), or None if ripgrep is not
+        installed or failed, in which case the caller searches in Python
+    """
+    if _RG_PATH is None:
+        return None
+
+    args = [
+        _RG_PATH, "--json", "--fixed-strings", "--ignore-case", "--max-count", "1",
+        "--hidden", "--no-ignore", "--no-messages",
+    ]
+    for ext in sorted(_TEXT_EXTENSIONS):
+        args += ["--iglob", f"*{ext}"]
+    args += ["--", query, directory]
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await process.communicate()
+    except OSError as e:
+        logger.warning(f"[RAG Service] ripgrep failed, falling back to Python search: {e}")
+        return None
+
+    # Exit code 1 means nothing matched; anything else is an error
+    if process.returncode not in (0, 1):
+        return None
+
+    matches = {}
+    for raw in stdout.splitlines():
+        event = json.loads(raw)
+        if event["type"] != "match":
+            continue
+        data = event["data"]
+        # ripgrep sends non-UTF-8 paths and lines base64-encoded
+        path = data["path"]
+        path = path["text"] if "text" in path else os.fsdecode(base64.b64decode(path["bytes"]))
+        lines = data["lines"]
+        if "text" in lines:
+            line = lines["text"]
+        else:
+            line = base64.b64decode(lines["bytes"]).decode('utf-8', errors='ignore')
+        matches[path] = (data["line_number"], line)
+    return matches
+
+
 @app.get("/files/search")
 async def search_files(
     query: str,
@@ -391,6 +508,12 @@ async def search_files(
     try:
         load_dir_abs = os.path.abspath(load_dir)
         results = []
+        query_lower = query.lower()
+
+        # Let ripgrep scan file contents when available; None means fall back to Python
+        content_matches = None
+        if search_content:
+            content_matches = await _rg_first_matches(query, load_dir_abs)
 
         for root, dirs, files in os.walk(load_dir_abs):
             for filename in files:
@@ -400,7 +523,7 @@ async def search_files(
                 rel_path = os.path.relpath(filepath, load_dir_abs)
 
                 # Filename search
-                if search_filename and query.lower() in filename.lower():
+                if search_filename and query_lower in filename.lower():
                     results.append({
                         "type": "filename_match",
                         "path": rel_path,
@@ -408,40 +531,23 @@ async def search_files(
                     })
                     # Don't continue - also check content if both flags are True
 
-                # Content search
-                if search_content:
-                    try:
-                        # Only search text-based files
-                        _, ext = os.path.splitext(filename)
-                        if ext.lower() in ['.txt', '.md', '.py', '.js', '.json', '.yaml', '.yml', '.html', '.css', '.sh', '.bash']:
-                            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                                for line_num, line in enumerate(f, 1):
-                                    if query.lower() in line.lower():
-                                        # Find keyword position for context extraction
-                                        keyword_pos = line.lower().find(query.lower())
-                                        line_stripped = line.strip()
-
-                                        # Extract context: 300 chars before + 300 chars after keyword
-                                        context_start = max(0, keyword_pos - 300)
-                                        context_end = min(len(line_stripped), keyword_pos + len(query) + 300)
-
-                                        # Add ellipsis if truncated
-                                        preview = line_stripped[context_start:context_end]
-                                        if context_start > 0:
-                                            preview = "..." + preview
-                                        if context_end < len(line_stripped):
-                                            preview = preview + "..."
-
-                                        results.append({
-                                            "type": "content_match",
-                                            "path": rel_path,
-                                            "name": filename,
-                                            "line_number": line_num,
-                                            "preview": preview,
-                                        })
-                                        break  # Only show first match per file
-                    except (PermissionError, UnicodeDecodeError):
-                        pass
+                # Content search (only text-based files)
+                _, ext = os.path.splitext(filename)
+                if search_content and ext.lower() in _TEXT_EXTENSIONS:
+                    if content_matches is not None:
+                        match = content_matches.get(filepath)
+                    else:
+                        match = _first_match(filepath, query_lower)
+
+                    if match is not None:
+                        line_num, line = match
+                        results.append({
+                            "type": "content_match",
+                            "path": rel_path,
+                            "name": filename,
+                            "line_number": line_num,
+                            "preview": _match_preview(line, query),
+                        })
 
         return {"success": True, "query": query, "results": results}
     except Exception as e:
@@ -449,6 +555,26 @@ async def search_files(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _read_line_range(full_path: str, line_start: int, line_end: Optional[int]):
+    """Read a file once, returning its line count and lines line_start..line_end.
+
+    Lines outside the range are not kept, so memory grows with the range rather
+    than the file.
+    """
+    for encoding in ('utf-8', 'latin-1'):
+        try:
+            with open(full_path, 'r', encoding=encoding) as f:
+                total_lines = 0
+                selected_lines = []
+                for total_lines, line in enumerate(f, 1):
+                    if line_start <= total_lines and (line_end is None or total_lines <= line_end):
+                        selected_lines.append(line)
+                return total_lines, selected_lines
+        except UnicodeDecodeError:
+            # Try with different encoding
+            continue
+
+
 @app.get("/files/content")
 async def get_file_content(path: str, line_start: Optional[int] = None, line_end: Optional[int] = None):
     """Get content of a specific file within load directory.
@@ -476,33 +602,18 @@ async def get_file_content(path: str, line_start: Optional[int] = None, line_end
         if not os.path.isfile(full_path):
             raise HTTPException(status_code=404, detail="File not found")
 
-        # Read file content
-        try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            with open(full_path, 'r', encoding='latin-1') as f:
-                lines = f.readlines()
-
-        total_lines = len(lines)
+        # Stream the file, keeping only the requested lines in memory
+        total_lines, selected_lines = _read_line_range(full_path, line_start or 1, line_end)
 
-        # Apply line range filter
+        # Validate line range
         if line_start is not None:
             if line_start < 1 or line_start > total_lines:
                 raise HTTPException(status_code=400, detail=f"Invalid line_start: {line_start}")
-            start_idx = line_start - 1
-        else:
-            start_idx = 0
 
         if line_end is not None:
-            if line_end < line_start or line_end > total_lines:
+            if line_end < (line_start or 1) or line_end > total_lines:
                 raise HTTPException(status_code=400, detail=f"Invalid line_end: {line_end}")
-            end_idx = line_end
-        else:
-            end_idx = total_lines
 
-        selected_lines = lines[start_idx:end_idx]
         content = ''.join(selected_lines)
 
         return {
@@ -521,6 +632,57 @@ async def get_file_content(path: str, line_start: Optional[int] = None, line_end
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/files/metadata")
+async def get_file_metadata(path: str):
+    """Get size, modification time and line count of a file within load directory.
+
+    Lines are counted while streaming the file, so this is much cheaper than
+    fetching the content just to learn its length.
+
+    Args:
+        path: Relative path to file within load directory
+
+    Returns:
+        File metadata
+    """
+    load_dir = config.get("rag.initialization.load_dir")
+    if not load_dir:
+        raise HTTPException(status_code=404, detail="No load directory configured")
+
+    try:
+        # Construct and validate full path
+        full_path = os.path.abspath(os.path.join(load_dir, path))
+        load_dir_abs = os.path.abspath(load_dir)
+
+        if not full_path.startswith(load_dir_abs):
+            raise HTTPException(status_code=403, detail="Access denied: path outside load directory")
+
+        if not os.path.isfile(full_path):
+            raise HTTPException(status_code=404, detail="File not found")
+
+        # Count lines the same way get_file_content splits them
+        try:
+            with open(full_path, 'r', encoding='utf-8') as f:
+                total_lines = sum(1 for _ in f)
+        except UnicodeDecodeError:
+            with open(full_path, 'r', encoding='latin-1') as f:
+                total_lines = sum(1 for _ in f)
+
+        stat = os.stat(full_path)
+        return {
+            "success": True,
+            "path": path,
+            "total_lines": total_lines,
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[RAG Service] Failed to get file metadata: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/files/markdown/structure")
 async def get_markdown_structure(path: str):
     """Analyze markdown file structure (headings and line count).
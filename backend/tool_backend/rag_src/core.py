@@ -28,6 +28,9 @@ class RAGService:
         model_path: str,
         index_path: str,
         device: str = "cpu",
+        batch_size: int = 64,
+        backend: Optional[str] = None,
+        quantize: Optional[int] = None,
         chunk_size: int = 500,
         overlap: int = 50,
         supported_formats: Optional[List[str]] = None,
@@ -40,6 +43,9 @@ class RAGService:
             model_path: Path to embedding model
             index_path: Path to vector index directory
             device: Device to run model on (cpu, mps, cuda)
+            batch_size: Number of texts encoded per model forward pass
+            backend: txtai ANN backend; None uses txtai's default
+            quantize: Bits per vector component (1-8); None keeps float32
             chunk_size: Text chunk size for document splitting
             overlap: Overlap between chunks
             supported_formats: List of supported file extensions
@@ -53,6 +59,9 @@ class RAGService:
             index_path=index_path,
             device=device,
             content=True,
+            batch_size=batch_size,
+            backend=backend,
+            quantize=quantize,
         )
 
         self.document_processor = DocumentProcessor(
@@ -5,10 +5,35 @@ using txtai's Textractor pipeline.
 """
 
 import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple, Optional
 from pathlib import Path
 
-from txtai.pipeline import Textractor
+# DocumentProcessor used inside each process_directory worker process
+_worker_processor: Optional["DocumentProcessor"] = None
+
+
+def _init_worker(
+    chunk_size: int, overlap: int, supported_formats: List[str]
+) -> None:
+    """Create the worker process's own DocumentProcessor (and Textractor)."""
+    global _worker_processor
+    _worker_processor = DocumentProcessor(chunk_size, overlap, supported_formats)
+
+
+def _process_in_worker(
+    job: Tuple[str, str]
+) -> Optional[List[Tuple[str, str, None]]]:
+    """Process one (file_path, document_id) job in a worker process."""
+    file_path, document_id = job
+    try:
+        return _worker_processor.process_file(file_path, document_id)
+    except Exception as e:
+        _worker_processor.logger.error(f"Failed to process {file_path}: {e}")
+        return None
 
 
 class DocumentProcessor:
@@ -18,7 +43,7 @@ class DocumentProcessor:
     prepares documents for vector indexing.
 
     Attributes:
-        textractor: txtai Textractor instance for text extraction
+        textractor: txtai Textractor instance for text extraction (created on first use)
         chunk_size: Maximum size of text chunks
         overlap: Overlap between chunks
         supported_formats: List of supported file extensions
@@ -45,9 +70,28 @@ class DocumentProcessor:
         self.supported_formats = (
             [fmt.lower() for fmt in (supported_formats or ["pdf", "txt", "md", "docx"])]
         )
-        self.textractor = Textractor()
+        self._format_set = frozenset(self.supported_formats)
+        self._textractor = None
+        self._textractor_lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
 
+    @property
+    def textractor(self):
+        """txtai Textractor, imported and created on first use.
+
+        The extraction pipeline pulls in heavy parsing libraries, so services that
+        only search never pay for importing it. Directory workers each build their
+        own processor, so the lock only guards first use from concurrent threads
+        of the same process.
+        """
+        if self._textractor is None:
+            with self._textractor_lock:
+                if self._textractor is None:
+                    from txtai.pipeline import Textractor
+
+                    self._textractor = Textractor()
+        return self._textractor
+
     def extract_text(self, file_path: str) -> str:
         """
         Extract text from a file.
@@ -69,7 +113,7 @@ class DocumentProcessor:
 
         extension = file_path_obj.suffix.lstrip(".").lower()
 
-        if extension not in self.supported_formats:
+        if extension not in self._format_set:
             raise ValueError(
                 f"Unsupported file format: .{extension}. "
                 f"Supported formats: {', '.join(self.supported_formats)}"
@@ -150,14 +194,22 @@ class DocumentProcessor:
             return []
 
     def process_directory(
-        self, directory_path: str, recursive: bool = True
+        self,
+        directory_path: str,
+        recursive: bool = True,
+        max_workers: Optional[int] = None,
     ) -> List[Tuple[str, str, None]]:
         """
         Process all supported files in a directory.
 
+        Files are extracted in parallel worker processes; chunks are returned
+        in file order.
+
         Args:
             directory_path: Path to the directory
             recursive: If True, recursively process subdirectories
+            max_workers: Number of worker processes. If None, uses one per CPU;
+                         1 processes all files in the calling process
 
         Returns:
             List of tuples (chunk_id, chunk_text, None) from all files
@@ -175,34 +227,44 @@ class DocumentProcessor:
         files_processed = 0
         files_failed = 0
 
-        # Find all files
-        if recursive:
-            files = [
-                p for p in directory.rglob("*")
-                if p.is_file() and p.suffix.lstrip(".").lower() in self.supported_formats
-            ]
-        else:
-            files = [
-                p for p in directory.iterdir()
-                if p.is_file() and p.suffix.lstrip(".").lower() in self.supported_formats
-            ]
+        # Find all files; the extension is checked first so only candidates are stat'ed
+        candidates = directory.rglob("*") if recursive else directory.iterdir()
+        files = [
+            p for p in candidates
+            if p.suffix.lstrip(".").lower() in self._format_set and p.is_file()
+        ]
 
         files_found = len(files)
         self.logger.info(f"Found {files_found} supported files in {directory_path}")
 
-        # Process each file
-        for file_path in files:
-            try:
-                # Use relative path as document ID for better organization
-                relative_path = file_path.relative_to(directory)
-                document_id = str(relative_path.with_suffix(""))
+        # Use relative path as document ID for better organization
+        jobs = [
+            (str(file_path), str(file_path.relative_to(directory).with_suffix("")))
+            for file_path in files
+        ]
+
+        # PDF parsing is CPU-bound, so files are spread over worker processes,
+        # each with its own Textractor; a single file is handled in-process.
+        # Workers are spawned rather than forked so they never inherit locks or
+        # threads held by the parent service
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        if workers > 1:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.chunk_size, self.overlap, self.supported_formats),
+            ) as executor:
+                results = list(executor.map(_process_in_worker, jobs, chunksize=4))
+        else:
+            results = [self.process_file(*job) for job in jobs]
 
-                chunks = self.process_file(str(file_path), document_id)
+        for chunks in results:
+            if chunks is None:
+                files_failed += 1
+            else:
                 all_chunks.extend(chunks)
                 files_processed += 1
-            except Exception as e:
-                self.logger.error(f"Failed to process {file_path}: {e}")
-                files_failed += 1
 
         self.logger.info(
             f"Directory processing complete: "
@@ -223,4 +285,4 @@ class DocumentProcessor:
             True if format is supported, False otherwise
         """
         extension = Path(file_path).suffix.lstrip(".").lower()
-        return extension in self.supported_formats
+        return extension in self._format_set
@@ -30,6 +30,9 @@ class EmbeddingManager:
         index_path: str,
         device: str = "cpu",
         content: bool = True,
+        batch_size: int = 64,
+        backend: Optional[str] = None,
+        quantize: Optional[int] = None,
     ):
         """
         Initialize the EmbeddingManager.
@@ -39,6 +42,11 @@ class EmbeddingManager:
             index_path: Directory path to store/load the vector index
             device: Device to run model on (cpu, mps, cuda)
             content: Whether to store original content in index
+            batch_size: Number of texts the model encodes per forward pass
+            backend: txtai ANN backend (e.g. "numpy" for a flat in-memory index).
+                     If None, uses txtai's default
+            quantize: Store vectors as integers with this many bits (1-8).
+                      If None, vectors are kept as float32
         """
         self.index_path = Path(index_path)
         self.content = content
@@ -47,14 +55,22 @@ class EmbeddingManager:
         # Convert model path to absolute path if it's a local path
         model_path = self._resolve_model_path(model_path)
 
-        # Initialize txtai Embeddings
+        # Initialize txtai Embeddings; txtai already feeds documents to the model in
+        # batches, encodebatch sets how many texts go through each forward pass
+        options = {"backend": backend} if backend else {}
+        if quantize:
+            options["quantize"] = quantize
         self.embeddings = Embeddings(
             path=model_path,
             content=content,
             device=device,
+            encodebatch=batch_size,
+            **options,
         )
 
         self._loaded = False
+        # Index state (see _index_signature) at the last failed load from search()
+        self._failed_load_signature: Optional[int] = -1
 
     def _resolve_model_path(self, model_path: str) -> str:
         """
@@ -121,17 +137,18 @@ class EmbeddingManager:
         Returns:
             List of search results with keys: id, score, text (if content=True)
         """
+        # Retry loading only when the index on disk changed since the last failure,
+        # rather than re-reading a missing or broken index on every query
         if not self._loaded:
-            self.logger.warning("Index not loaded, attempting to load from disk")
-            self.load()
+            signature = self._index_signature()
+            if signature != self._failed_load_signature:
+                self.logger.warning("Index not loaded, attempting to load from disk")
+                if not self.load():
+                    self._failed_load_signature = signature
 
         try:
-            # txtai search parameters
-            search_params = {}
-            if limit is not None:
-                search_params["limit"] = limit
-
-            results = self.embeddings.search(query, **search_params)
+            # txtai applies its default limit when limit is None
+            results = self.embeddings.search(query, limit)
 
             # Apply threshold filtering manually if specified
             if threshold is not None:
@@ -200,6 +217,21 @@ class EmbeddingManager:
             self.logger.error(f"Failed to load index: {e}")
             return False
 
+    def _index_signature(self) -> Optional[int]:
+        """
+        Get the latest modification time of the index on disk.
+
+        Returns:
+            Modification time in nanoseconds, or None if there is no index
+        """
+        try:
+            if self.index_path.is_dir():
+                with os.scandir(self.index_path) as entries:
+                    return max((e.stat().st_mtime_ns for e in entries), default=0)
+            return self.index_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
     def exists(self) -> bool:
         """Check if index file exists on disk.
 
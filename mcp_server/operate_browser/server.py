@@ -6,14 +6,144 @@ allowing agents to interact with web pages through a standardized MCP interface.
 """
 
 import asyncio
+import fnmatch
+import functools
+import inspect
+import itertools
 import json
+import os
+import re
+from collections import OrderedDict, deque
 from mcp.server.fastmcp import FastMCP
-from typing import Optional, Dict, Any, List
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+from typing import Optional, Dict, Any, List, Tuple, Callable, Union, Awaitable
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    Page,
+    BrowserContext,
+    JSHandle,
+    Locator,
+)
 from pathlib import Path
 
 mcp = FastMCP("Operate-Browser")
 
+# Default element timeout (ms) for interaction tools, tunable per deployment
+_DEFAULT_TIMEOUT = int(os.getenv("INTELLISEARCH_DEFAULT_TIMEOUT", "1500"))
+
+# Longer timeout (ms) kept for known-slow actions: file uploads and form submits
+_SLOW_ACTION_TIMEOUT = max(_DEFAULT_TIMEOUT, 5000)
+
+# Maximum number of HTTP request log entries retained by BrowserManager
+_REQUEST_LOG_SIZE = 5000
+
+# Maximum number of (page, selector) locators kept by BrowserManager
+_LOCATOR_CACHE_SIZE = 512
+
+# Maximum number of compiled (page, code) JavaScript functions kept alive
+_JS_HANDLE_CACHE_SIZE = 128
+
+# Wraps a script so it is parsed once and re-run on every call
+_JS_FUNCTION_TEMPLATE = """() => () => {{
+    const value = (
+{code}
+    );
+    return typeof value === 'function' ? value() : value;
+}}"""
+
+# Returns a (document token, mutation count) pair identifying the DOM state;
+# the observer is installed on first use and resets with each new document
+_DOM_VERSION_SCRIPT = """() => {
+    if (window.__intellisearchDomToken === undefined) {
+        window.__intellisearchDomToken = Math.random().toString(36).slice(2);
+        window.__intellisearchDomVersion = 0;
+        new MutationObserver(() => { window.__intellisearchDomVersion++; }).observe(
+            document,
+            {subtree: true, childList: true, attributes: true, characterData: true}
+        );
+    }
+    return window.__intellisearchDomToken + ':' + window.__intellisearchDomVersion;
+}"""
+
+
+def _dump(result: Any) -> str:
+    """Serialize an evaluation result to a string."""
+    if not isinstance(result, (dict, list)):
+        return str(result)
+    return json.dumps(result, ensure_ascii=False)
+
+
+def _err(op: str, target: Optional[str], e: Exception) -> str:
+    """Format a tool failure message."""
+    if target is None:
+        return f"Failed to {op}: {str(e)}"
+    return f"Failed to {op} '{target}': {str(e)}"
+
+
+def tool_errors(
+    op: Union[str, Callable[[Dict[str, Any]], str]],
+    target: Optional[str] = None,
+    on_error: Optional[Callable[[str], Any]] = None,
+):
+    """
+    Decorator turning exceptions raised by a tool into its error return value.
+
+    Keeps tool bodies limited to the success path. The message is built with
+    _err only when the tool actually fails.
+
+    Args:
+        op: The operation name used in the message, or a callable computing it
+            from the bound tool arguments.
+        target: Name of the argument to quote in the message, if any.
+        on_error: Converts the message to the tool's return type. Defaults to
+                  returning the message string itself.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                bound = signature.bind_partial(*args, **kwargs)
+                bound.apply_defaults()
+                arguments = bound.arguments
+                name = op(arguments) if callable(op) else op
+                error_msg = _err(name, arguments.get(target) if target else None, e)
+                return on_error(error_msg) if on_error else error_msg
+
+        return wrapper
+
+    return decorator
+
+
+def _glob_fragment(pattern: str) -> str:
+    """Translate a glob with fnmatch, without the end-of-string anchor."""
+    fragment = fnmatch.translate(pattern)
+    for anchor in ("\\Z", "\\z"):
+        if fragment.endswith(anchor):
+            return fragment[: -len(anchor)]
+    return fragment
+
+
+def _compile_url_patterns(patterns: List[str]) -> Optional[re.Pattern]:
+    """
+    Compile URL block patterns into a single regex, or None if there are none.
+
+    Patterns containing glob wildcards (* or [) are translated with fnmatch,
+    plain patterns (including ones with a literal ?) match as substrings. Both
+    kinds may match anywhere in the URL, so "*.png" also blocks "a.png?v=1".
+    """
+    if not patterns:
+        return None
+    fragments = [
+        _glob_fragment(p) if any(c in p for c in "*[") else re.escape(p)
+        for p in patterns
+    ]
+    return re.compile("|".join(fragments))
+
 
 class BrowserManager:
     """
@@ -29,8 +159,16 @@ class BrowserManager:
         _context: The active BrowserContext for cookies and storage.
         _pages: Dictionary tracking all open pages/tabs by ID.
         _current_page_id: ID of the currently active page.
+        _current_page: Cached reference to the currently active Page.
         _next_page_id: Counter for generating unique page IDs.
-        _request_logs: List storing HTTP request/response logs.
+        _request_logs: Bounded ring buffer storing HTTP request/response logs.
+        _locator_cache: LRU of locators keyed by (id(page), selector).
+        _js_handle_cache: LRU of compiled JS function handles keyed by (id(page), code).
+        _js_uncompilable: LRU of (id(page), code) keys whose script could not be
+            wrapped into a function, so later calls skip straight to evaluate().
+        _dialog_handlers: The registered dialog handler per page, keyed by id(page).
+        _snapshot_cache: Page snapshots (HTML, structure, visible text) keyed by
+            (id(page), kind), stored with the DOM version they were taken at.
     """
 
     _instance = None
@@ -50,8 +188,16 @@ class BrowserManager:
         self._context: Optional[BrowserContext] = None
         self._pages: Dict[str, Page] = {}
         self._current_page_id: Optional[str] = None
+        self._current_page: Optional[Page] = None
         self._next_page_id = 1
-        self._request_logs: List[Dict[str, Any]] = []
+        self._request_logs: "deque[Dict[str, Any]]" = deque(maxlen=_REQUEST_LOG_SIZE)
+        self._locator_cache: "OrderedDict[Tuple[int, str], Locator]" = OrderedDict()
+        self._js_handle_cache: "OrderedDict[Tuple[int, str], JSHandle]" = (
+            OrderedDict()
+        )
+        self._js_uncompilable: "OrderedDict[Tuple[int, str], None]" = OrderedDict()
+        self._dialog_handlers: Dict[int, Callable] = {}
+        self._snapshot_cache: Dict[Tuple[int, str], Tuple[str, Any]] = {}
         self._initialized = True
 
     async def get_browser(self, headless: bool = True) -> Browser:
@@ -109,30 +255,189 @@ class BrowserManager:
         """
         if self._current_page_id is None or self._current_page_id not in self._pages:
             # Create a new page if none exists
-            context = await self.get_context()
-            page = await context.new_page()
-            page_id = str(self._next_page_id)
-            self._next_page_id += 1
-            self._pages[page_id] = page
-            self._current_page_id = page_id
+            await self.new_page()
+
+        return self._current_page
+
+    @property
+    def current_page(self) -> Page:
+        """
+        Synchronous access to the cached active page.
+
+        The reference is kept in sync by new_page, switch_page and close_page,
+        so hot tools can skip the lookup done by get_current_page.
+
+        Returns:
+            The active Page instance.
 
-        return self._pages[self._current_page_id]
+        Raises:
+            RuntimeError: If no page is currently active.
+        """
+        if self._current_page is None:
+            raise RuntimeError("No active page, open a URL or a new tab first")
+        return self._current_page
 
-    async def new_page(self) -> str:
+    async def new_page(self, url: Optional[str] = None) -> str:
         """
         Create a new page/tab and make it the current page.
 
+        Args:
+            url: Optional URL to navigate the new page to.
+
         Returns:
             The ID of the newly created page.
         """
         context = await self.get_context()
         page = await context.new_page()
+        page.on("framenavigated", self._on_frame_navigated)
         page_id = str(self._next_page_id)
         self._next_page_id += 1
         self._pages[page_id] = page
         self._current_page_id = page_id
+        self._current_page = page
+
+        if url:
+            await page.goto(url)
+
         return page_id
 
+    def get_locator(self, page: Page, selector: str) -> Locator:
+        """
+        Get a cached locator for the first element matching a selector.
+
+        Locators are reused across calls for the same page and selector, and
+        dropped when the page navigates or is closed. The locator targets the
+        first match, like the non-strict page-level actions.
+
+        Args:
+            page: The page the selector applies to.
+            selector: The CSS or XPath selector.
+
+        Returns:
+            The Locator for the selector on the given page.
+        """
+        key = (id(page), selector)
+        locator = self._locator_cache.get(key)
+
+        if locator is None:
+            locator = page.locator(selector).first
+            self._locator_cache[key] = locator
+            if len(self._locator_cache) > _LOCATOR_CACHE_SIZE:
+                self._locator_cache.popitem(last=False)
+        else:
+            self._locator_cache.move_to_end(key)
+
+        return locator
+
+    async def get_js_function(self, page: Page, code: str) -> Optional[JSHandle]:
+        """
+        Get a cached in-page function handle that evaluates a script.
+
+        The script is compiled into a function the first time it is seen on a
+        page, so repeated calls only invoke the existing function. Scripts that
+        fail to compile are remembered too, so they are not retried. Both are
+        dropped when the page navigates or is closed.
+
+        Args:
+            page: The page to evaluate the script in.
+            code: The JavaScript expression or function source.
+
+        Returns:
+            The JSHandle of the compiled function, or None if the script cannot
+            be wrapped into an expression (e.g. it contains statements).
+        """
+        key = (id(page), code)
+        handle = self._js_handle_cache.get(key)
+
+        if handle is not None:
+            self._js_handle_cache.move_to_end(key)
+            return handle
+
+        if key in self._js_uncompilable:
+            self._js_uncompilable.move_to_end(key)
+            return None
+
+        try:
+            handle = await page.evaluate_handle(
+                _JS_FUNCTION_TEMPLATE.format(code=code)
+            )
+        except Exception as e:
+            if "SyntaxError" in str(e):
+                self._js_uncompilable[key] = None
+                if len(self._js_uncompilable) > _JS_HANDLE_CACHE_SIZE:
+                    self._js_uncompilable.popitem(last=False)
+            return None
+
+        self._js_handle_cache[key] = handle
+        if len(self._js_handle_cache) > _JS_HANDLE_CACHE_SIZE:
+            _, evicted = self._js_handle_cache.popitem(last=False)
+            try:
+                await evicted.dispose()
+            except Exception:
+                pass
+
+        return handle
+
+    def set_dialog_handler(self, page: Page, handler: Callable):
+        """
+        Register the dialog handler of a page, replacing any previous one.
+
+        Args:
+            page: The page to listen for dialogs on.
+            handler: The callback invoked with each Dialog.
+        """
+        previous = self._dialog_handlers.pop(id(page), None)
+        if previous is not None:
+            page.remove_listener("dialog", previous)
+
+        page.on("dialog", handler)
+        self._dialog_handlers[id(page)] = handler
+
+    async def get_snapshot(
+        self, page: Page, kind: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Get a whole-page snapshot, reusing the last one if the DOM is unchanged.
+
+        A MutationObserver in the page counts DOM changes, so checking the cache
+        costs one small evaluate instead of re-serializing or re-walking the DOM.
+
+        Args:
+            page: The page to snapshot.
+            kind: Name of the snapshot, e.g. "html", "structure" or "visible_text".
+            loader: Coroutine function producing a fresh snapshot.
+
+        Returns:
+            The cached or freshly loaded snapshot.
+        """
+        key = (id(page), kind)
+        version = await page.evaluate(_DOM_VERSION_SCRIPT)
+
+        cached = self._snapshot_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        value = await loader()
+        self._snapshot_cache[key] = (version, value)
+        return value
+
+    def _invalidate_page_cache(self, page: Page):
+        """Drop all cached locators, JS handles and snapshots of the given page."""
+        page_key = id(page)
+        for cache in (
+            self._locator_cache,
+            self._js_handle_cache,
+            self._js_uncompilable,
+            self._snapshot_cache,
+        ):
+            for key in [k for k in cache if k[0] == page_key]:
+                del cache[key]
+
+    def _on_frame_navigated(self, frame):
+        """Invalidate per-page caches when a page's main frame navigates."""
+        if frame.parent_frame is None:
+            self._invalidate_page_cache(frame.page)
+
     async def switch_page(self, page_id: str) -> bool:
         """
         Switch to a different page/tab.
@@ -145,6 +450,7 @@ class BrowserManager:
         """
         if page_id in self._pages:
             self._current_page_id = page_id
+            self._current_page = self._pages[page_id]
             return True
         return False
 
@@ -161,6 +467,8 @@ class BrowserManager:
         target_id = page_id or self._current_page_id
 
         if target_id and target_id in self._pages:
+            self._invalidate_page_cache(self._pages[target_id])
+            self._dialog_handlers.pop(id(self._pages[target_id]), None)
             await self._pages[target_id].close()
             del self._pages[target_id]
 
@@ -169,6 +477,9 @@ class BrowserManager:
                 self._current_page_id = (
                     list(self._pages.keys())[0] if self._pages else None
                 )
+                self._current_page = (
+                    self._pages[self._current_page_id] if self._pages else None
+                )
 
             return True
         return False
@@ -180,16 +491,21 @@ class BrowserManager:
         Returns:
             List of dictionaries containing page IDs, URLs, and titles.
         """
+        pages = list(self._pages.items())
+
+        # Titles are independent per tab, fetch them concurrently
+        titles = await asyncio.gather(
+            *(page.title() for _, page in pages), return_exceptions=True
+        )
+
         pages_info = []
-        for page_id, page in self._pages.items():
-            try:
-                pages_info.append(
-                    {"page_id": page_id, "url": page.url, "title": await page.title()}
-                )
-            except Exception as e:
+        for (page_id, page), title in zip(pages, titles):
+            if isinstance(title, Exception):
                 pages_info.append(
                     {"page_id": page_id, "url": "unknown", "title": "unknown"}
                 )
+            else:
+                pages_info.append({"page_id": page_id, "url": page.url, "title": title})
         return pages_info
 
     async def close(self):
@@ -207,7 +523,13 @@ class BrowserManager:
             self._playwright = None
 
         self._pages.clear()
+        self._locator_cache.clear()
+        self._js_handle_cache.clear()
+        self._js_uncompilable.clear()
+        self._dialog_handlers.clear()
+        self._snapshot_cache.clear()
         self._current_page_id = None
+        self._current_page = None
 
 
 # Global browser manager instance
@@ -772,7 +1094,8 @@ async def get_element_attribute(
 
 
 @mcp.tool()
-async def hover_element(selector: str, timeout: int = 5000) -> str:
+@tool_errors("hover over", "selector")
+async def hover_element(selector: str, timeout: int = _DEFAULT_TIMEOUT) -> str:
     """
     Hovers the mouse cursor over a specific element.
 
@@ -783,7 +1106,7 @@ async def hover_element(selector: str, timeout: int = 5000) -> str:
         selector (str): The CSS or XPath selector of the element to hover over.
                        Examples: '.menu-item', '#dropdown-trigger', '.tooltip-trigger'.
         timeout (int): Maximum time in milliseconds to wait for the element to appear.
-                      Default is 5000 (5 seconds).
+                      Default is 1500 (INTELLISEARCH_DEFAULT_TIMEOUT).
 
     Returns:
         str: Success message, or error message if element not found or hover fails.
@@ -797,18 +1120,14 @@ async def hover_element(selector: str, timeout: int = 5000) -> str:
     Raises:
         Exception: If element not found or hover operation fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
-        await page.hover(selector, timeout=timeout)
-        return f"Successfully hovered over element: {selector}"
-
-    except Exception as e:
-        error_msg = f"Failed to hover over '{selector}': {str(e)}"
-        return error_msg
+    page = browser_manager.current_page
+    await browser_manager.get_locator(page, selector).hover(timeout=timeout)
+    return f"Successfully hovered over element: {selector}"
 
 
 @mcp.tool()
-async def double_click(selector: str, timeout: int = 5000) -> str:
+@tool_errors("double-click", "selector")
+async def double_click(selector: str, timeout: int = _DEFAULT_TIMEOUT) -> str:
     """
     Performs a double-click action on an element.
 
@@ -819,7 +1138,7 @@ async def double_click(selector: str, timeout: int = 5000) -> str:
         selector (str): The CSS or XPath selector of the element to double-click.
                        Examples: '.file', 'button#edit', '.icon'.
         timeout (int): Maximum time in milliseconds to wait for the element to appear.
-                      Default is 5000 (5 seconds).
+                      Default is 1500 (INTELLISEARCH_DEFAULT_TIMEOUT).
 
     Returns:
         str: Success message, or error message if element not found or click fails.
@@ -833,18 +1152,14 @@ async def double_click(selector: str, timeout: int = 5000) -> str:
     Raises:
         Exception: If element not found or double-click operation fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
-        await page.dblclick(selector, timeout=timeout)
-        return f"Successfully double-clicked element: {selector}"
-
-    except Exception as e:
-        error_msg = f"Failed to double-click '{selector}': {str(e)}"
-        return error_msg
+    page = browser_manager.current_page
+    await browser_manager.get_locator(page, selector).dblclick(timeout=timeout)
+    return f"Successfully double-clicked element: {selector}"
 
 
 @mcp.tool()
-async def right_click(selector: str, timeout: int = 5000) -> str:
+@tool_errors("right-click", "selector")
+async def right_click(selector: str, timeout: int = _DEFAULT_TIMEOUT) -> str:
     """
     Performs a right-click (context menu) action on an element.
 
@@ -854,7 +1169,7 @@ async def right_click(selector: str, timeout: int = 5000) -> str:
         selector (str): The CSS or XPath selector of the element to right-click.
                        Examples: '.file', '#element', 'table.row'.
         timeout (int): Maximum time in milliseconds to wait for the element to appear.
-                      Default is 5000 (5 seconds).
+                      Default is 1500 (INTELLISEARCH_DEFAULT_TIMEOUT).
 
     Returns:
         str: Success message, or error message if element not found or click fails.
@@ -868,14 +1183,11 @@ async def right_click(selector: str, timeout: int = 5000) -> str:
     Raises:
         Exception: If element not found or right-click operation fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
-        await page.click(selector, button="right", timeout=timeout)
-        return f"Successfully right-clicked element: {selector}"
-
-    except Exception as e:
-        error_msg = f"Failed to right-click '{selector}': {str(e)}"
-        return error_msg
+    page = browser_manager.current_page
+    await browser_manager.get_locator(page, selector).click(
+        button="right", timeout=timeout
+    )
+    return f"Successfully right-clicked element: {selector}"
 
 
 # ============================================================================
@@ -884,8 +1196,9 @@ async def right_click(selector: str, timeout: int = 5000) -> str:
 
 
 @mcp.tool()
+@tool_errors("press key", "key")
 async def press_key(
-    key: str, selector: Optional[str] = None, timeout: int = 5000
+    key: str, selector: Optional[str] = None, timeout: int = _DEFAULT_TIMEOUT
 ) -> str:
     """
     Simulates pressing a keyboard key.
@@ -903,7 +1216,7 @@ async def press_key(
         selector (str, optional): The CSS or XPath selector of an element to focus before pressing.
                                   If None, presses the key on the currently focused element.
         timeout (int): Maximum time in milliseconds to wait for the selector if provided.
-                      Default is 5000 (5 seconds).
+                      Default is 1500 (INTELLISEARCH_DEFAULT_TIMEOUT).
 
     Returns:
         str: Success message, or error message if operation fails.
@@ -919,25 +1232,32 @@ async def press_key(
     Raises:
         Exception: If selector is invalid or key press fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
+    page = browser_manager.current_page
 
-        if selector:
-            await page.wait_for_selector(selector, timeout=timeout)
-            page.locator(selector).focus()
+    # Plain characters are typed directly, skipping the key-combination parser
+    is_char = len(key) == 1
 
+    if selector:
+        # Focus and press in one auto-waiting action on the target element
+        locator = browser_manager.get_locator(page, selector)
+        if is_char:
+            await locator.press_sequentially(key, timeout=timeout)
+        else:
+            await locator.press(key, timeout=timeout)
+    elif is_char:
+        await page.keyboard.type(key)
+    else:
         await page.keyboard.press(key)
 
-        target_msg = f" on {selector}" if selector else ""
-        return f"Successfully pressed key: {key}{target_msg}"
-
-    except Exception as e:
-        error_msg = f"Failed to press key '{key}': {str(e)}"
-        return error_msg
+    target_msg = f" on {selector}" if selector else ""
+    return f"Successfully pressed key: {key}{target_msg}"
 
 
 @mcp.tool()
-async def upload_file(selector: str, file_path: str, timeout: int = 5000) -> str:
+@tool_errors("upload file", "file_path")
+async def upload_file(
+    selector: str, file_path: str, timeout: int = _SLOW_ACTION_TIMEOUT
+) -> str:
     """
     Uploads a file to a file input element.
 
@@ -949,7 +1269,7 @@ async def upload_file(selector: str, file_path: str, timeout: int = 5000) -> str
         file_path (str): Absolute or relative path to the file to upload.
                         Examples: '/Users/user/Documents/file.pdf', './data.csv'.
         timeout (int): Maximum time in milliseconds to wait for the element to appear.
-                      Default is 5000 (5 seconds).
+                      Default is 5000, or INTELLISEARCH_DEFAULT_TIMEOUT if larger.
 
     Returns:
         str: Success message with file name, or error message if upload fails.
@@ -963,21 +1283,19 @@ async def upload_file(selector: str, file_path: str, timeout: int = 5000) -> str
     Raises:
         Exception: If element not found, file doesn't exist, or upload fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
-        await page.wait_for_selector(selector, timeout=timeout)
+    page = browser_manager.current_page
 
-        # Convert to absolute path if relative
-        file_abs_path = str(Path(file_path).absolute())
+    # Resolve off the event loop; strict mode fails early on missing files
+    file_abs_path = await asyncio.to_thread(
+        lambda: str(Path(file_path).resolve(strict=True))
+    )
 
-        await page.set_input_files(selector, file_abs_path)
+    await browser_manager.get_locator(page, selector).set_input_files(
+        file_abs_path, timeout=timeout
+    )
 
-        file_name = Path(file_path).name
-        return f"Successfully uploaded file: {file_name}"
-
-    except Exception as e:
-        error_msg = f"Failed to upload file '{file_path}': {str(e)}"
-        return error_msg
+    file_name = Path(file_path).name
+    return f"Successfully uploaded file: {file_name}"
 
 
 # ============================================================================
@@ -986,8 +1304,9 @@ async def upload_file(selector: str, file_path: str, timeout: int = 5000) -> str
 
 
 @mcp.tool()
+@tool_errors("fill form")
 async def fill_form(
-    fields: Dict[str, str], submit: bool = False, timeout: int = 5000
+    fields: Dict[str, str], submit: bool = False, timeout: int = _DEFAULT_TIMEOUT
 ) -> str:
     """
     Fills multiple form fields at once.
@@ -1007,7 +1326,7 @@ async def fill_form(
         submit (bool): If True, submits the form after filling by pressing Enter
                       on the last field or clicking a submit button. Default is False.
         timeout (int): Maximum time in milliseconds to wait for each element.
-                      Default is 5000 (5 seconds).
+                      Default is 1500 (INTELLISEARCH_DEFAULT_TIMEOUT).
 
     Returns:
         str: Success message listing filled fields, or error message if any fill fails.
@@ -1021,58 +1340,45 @@ async def fill_form(
     Raises:
         Exception: If any selector is invalid or fill operation fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
+    page = browser_manager.current_page
 
-        filled_count = 0
-        field_names = []
+    # Extract field names from selectors for reporting
+    field_names = [selector.split("[")[-1].rstrip('"]') for selector in fields]
 
-        for selector, value in fields.items():
-            await page.wait_for_selector(selector, timeout=timeout)
-            await page.fill(selector, value)
-            filled_count += 1
+    # Fill one field at a time: fill() types into whichever element has focus
+    for selector, value in fields.items():
+        await page.fill(selector, value, timeout=timeout)
 
-            # Extract field name from selector for reporting
-            field_name = selector.split("[")[-1].rstrip('"]')
-            field_names.append(field_name)
+    filled_count = len(field_names)
 
+    if submit:
+        # Try to find and click a submit button, or press Enter
+        submit_locator = page.locator(
+            'button[type="submit"], input[type="submit"], button:has-text("Submit")'
+        ).first
 
-        if submit:
-            # Try to find and click a submit button, or press Enter
-            submit_selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button:has-text("Submit")',
-            ]
-            submitted = False
+        # A present submit button gets the longer timeout to become clickable;
+        # without one, fall back to Enter straight away
+        try:
+            if not await submit_locator.count():
+                raise LookupError("no submit button")
+            await submit_locator.click(timeout=_SLOW_ACTION_TIMEOUT)
+        except Exception:
+            await page.keyboard.press("Enter")
 
-            for submit_selector in submit_selectors:
-                try:
-                    await page.click(submit_selector, timeout=1000)
-                    submitted = True
-                    break
-                except Exception:
-                    continue
+        return f"Filled {filled_count} fields: {', '.join(field_names)} and submitted form"
 
-            if not submitted:
-                await page.keyboard.press("Enter")
-
-            return f"Filled {filled_count} fields: {', '.join(field_names)} and submitted form"
-
-        return f"Filled {filled_count} fields: {', '.join(field_names)}"
-
-    except Exception as e:
-        error_msg = f"Failed to fill form: {str(e)}"
-        return error_msg
+    return f"Filled {filled_count} fields: {', '.join(field_names)}"
 
 
 @mcp.tool()
+@tool_errors("select option from", "selector")
 async def select_option(
     selector: str,
     value: Optional[str] = None,
     label: Optional[str] = None,
     index: Optional[int] = None,
-    timeout: int = 5000,
+    timeout: int = _DEFAULT_TIMEOUT,
 ) -> str:
     """
     Selects an option from a dropdown (select) element.
@@ -1089,7 +1395,7 @@ async def select_option(
         index (int, optional): Select by option index (0-based).
                              Example: index=0 selects the first option.
         timeout (int): Maximum time in milliseconds to wait for the element.
-                      Default is 5000 (5 seconds).
+                      Default is 1500 (INTELLISEARCH_DEFAULT_TIMEOUT).
 
     Returns:
         str: Success message indicating which option was selected, or error message.
@@ -1105,30 +1411,26 @@ async def select_option(
     Raises:
         Exception: If selector invalid, element not found, or selection fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
-        await page.wait_for_selector(selector, timeout=timeout)
+    page = browser_manager.current_page
+    locator = browser_manager.get_locator(page, selector)
 
-        if value:
-            await page.select_option(selector, value=value)
-            return f"Selected option by value: {value}"
-        elif label:
-            await page.select_option(selector, label=label)
-            return f"Selected option by label: {label}"
-        elif index is not None:
-            await page.select_option(selector, index=index)
-            return f"Selected option by index: {index}"
-        else:
-            return "Error: Must specify value, label, or index"
-
-    except Exception as e:
-        error_msg = f"Failed to select option from '{selector}': {str(e)}"
-        return error_msg
+    if value:
+        await locator.select_option(value=value, timeout=timeout)
+        return f"Selected option by value: {value}"
+    elif label:
+        await locator.select_option(label=label, timeout=timeout)
+        return f"Selected option by label: {label}"
+    elif index is not None:
+        await locator.select_option(index=index, timeout=timeout)
+        return f"Selected option by index: {index}"
+    else:
+        return "Error: Must specify value, label, or index"
 
 
 @mcp.tool()
+@tool_errors(lambda args: "check" if args["checked"] else "uncheck", "selector")
 async def check_checkbox(
-    selector: str, checked: bool = True, timeout: int = 5000
+    selector: str, checked: bool = True, timeout: int = _DEFAULT_TIMEOUT
 ) -> str:
     """
     Checks or unchecks a checkbox or radio button.
@@ -1141,7 +1443,7 @@ async def check_checkbox(
         checked (bool): True to check the element, False to uncheck.
                        Default is True.
         timeout (int): Maximum time in milliseconds to wait for the element.
-                      Default is 5000 (5 seconds).
+                      Default is 1500 (INTELLISEARCH_DEFAULT_TIMEOUT).
 
     Returns:
         str: Success message, or error message if operation fails.
@@ -1155,27 +1457,20 @@ async def check_checkbox(
     Raises:
         Exception: If selector invalid or element not found.
     """
-    try:
-        page = await browser_manager.get_current_page()
-        await page.wait_for_selector(selector, timeout=timeout)
-
-        if checked:
-            await page.check(selector)
-        else:
-            await page.uncheck(selector)
-
-        action = "Checked" if checked else "Unchecked"
-        return f"{action} element: {selector}"
+    page = browser_manager.current_page
+    await browser_manager.get_locator(page, selector).set_checked(
+        checked, timeout=timeout
+    )
 
-    except Exception as e:
-        error_msg = (
-            f"Failed to {'check' if checked else 'uncheck'} '{selector}': {str(e)}"
-        )
-        return error_msg
+    action = "Checked" if checked else "Unchecked"
+    return f"{action} element: {selector}"
 
 
 @mcp.tool()
-async def get_all_links(selector: str = "a") -> List[Dict[str, str]]:
+@tool_errors("get links", on_error=lambda msg: [{"error": msg}])
+async def get_all_links(
+    selector: str = "a", limit: int = 1000
+) -> List[Dict[str, Any]]:
     """
     Extracts all links from the page or from a specific section.
 
@@ -1184,12 +1479,15 @@ async def get_all_links(selector: str = "a") -> List[Dict[str, str]]:
     Args:
         selector (str): CSS selector to scope the link search. Defaults to "a" (all links).
                        Examples: "a" (all), ".content a" (links in content area), "#menu a" (menu links).
+        limit (int): Maximum number of links to return. Default is 1000.
 
     Returns:
         list: List of dictionaries, each containing:
               - text (str): The visible link text.
               - href (str): The URL the link points to.
               - title (str): The title attribute (if present).
+              If more than `limit` links match, a final entry
+              {"truncated": true, "total": N} is appended.
 
     Examples:
         >>> await get_all_links()
@@ -1203,29 +1501,26 @@ async def get_all_links(selector: str = "a") -> List[Dict[str, str]]:
     Raises:
         Exception: If link extraction fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
+    page = browser_manager.current_page
 
-        links = await page.locator(selector).all()
-        result = []
-
-        for link in links:
-            try:
-                text = await link.inner_text()
-                href = await link.get_attribute("href")
-                title = await link.get_attribute("title") or ""
-
-                result.append(
-                    {"text": text.strip(), "href": href or "", "title": title}
-                )
-            except Exception:
-                continue
+    # Extract links in a single round-trip, only serializing the first `limit`
+    extracted = await page.locator(selector).evaluate_all(
+        """(els, limit) => ({
+            total: els.length,
+            links: els.slice(0, limit).map(a => ({
+                text: (a.innerText || '').trim(),
+                href: a.getAttribute('href') || '',
+                title: a.getAttribute('title') || ''
+            }))
+        })""",
+        limit,
+    )
 
-        return result
+    result = extracted["links"]
+    if extracted["total"] > len(result):
+        result.append({"truncated": True, "total": extracted["total"]})
 
-    except Exception as e:
-        error_msg = f"Failed to get links: {str(e)}"
-        return [{"error": error_msg}]
+    return result
 
 
 # ============================================================================
@@ -1234,6 +1529,7 @@ async def get_all_links(selector: str = "a") -> List[Dict[str, str]]:
 
 
 @mcp.tool()
+@tool_errors("execute JavaScript")
 async def execute_javascript(code: str) -> str:
     """
     Executes arbitrary JavaScript code in the page context.
@@ -1262,24 +1558,19 @@ async def execute_javascript(code: str) -> str:
     Raises:
         Exception: If code execution fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
-        result = await page.evaluate(code)
-
-        # Convert result to string
-        if isinstance(result, (dict, list)):
-            result_str = json.dumps(result, ensure_ascii=False)
-        else:
-            result_str = str(result)
+    page = browser_manager.current_page
 
-        return result_str
+    handle = await browser_manager.get_js_function(page, code)
+    if handle is not None:
+        result = await handle.evaluate("fn => fn()")
+    else:
+        result = await page.evaluate(code)
 
-    except Exception as e:
-        error_msg = f"Failed to execute JavaScript: {str(e)}"
-        return error_msg
+    return _dump(result)
 
 
 @mcp.tool()
+@tool_errors("evaluate function")
 async def evaluate_function(function: str, *args) -> str:
     """
     Evaluates a JavaScript function with arguments.
@@ -1306,21 +1597,10 @@ async def evaluate_function(function: str, *args) -> str:
     Raises:
         Exception: If function evaluation fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
-        result = await page.evaluate(function, *args)
-
-        result_str = (
-            json.dumps(result, ensure_ascii=False)
-            if isinstance(result, (dict, list))
-            else str(result)
-        )
+    page = browser_manager.current_page
+    result = await page.evaluate(function, *args)
 
-        return result_str
-
-    except Exception as e:
-        error_msg = f"Failed to evaluate function: {str(e)}"
-        return error_msg
+    return _dump(result)
 
 
 # ============================================================================
@@ -1329,6 +1609,7 @@ async def evaluate_function(function: str, *args) -> str:
 
 
 @mcp.tool()
+@tool_errors("handle dialog")
 async def handle_dialog(action: str, prompt_text: Optional[str] = None) -> str:
     """
     Handles JavaScript alerts, confirms, and prompts.
@@ -1358,28 +1639,23 @@ async def handle_dialog(action: str, prompt_text: Optional[str] = None) -> str:
     Raises:
         Exception: If action is invalid or dialog handling fails.
     """
-    try:
-        if action not in ["accept", "dismiss"]:
-            return "Error: action must be 'accept' or 'dismiss'"
+    if action not in ["accept", "dismiss"]:
+        return "Error: action must be 'accept' or 'dismiss'"
 
-        page = await browser_manager.get_current_page()
+    page = browser_manager.current_page
 
-        async def handle_dialog(dialog):
-            if action == "accept":
-                if prompt_text and dialog.type == "prompt":
-                    await dialog.accept(prompt_text)
-                else:
-                    await dialog.accept()
+    async def handle_dialog(dialog):
+        if action == "accept":
+            if prompt_text and dialog.type == "prompt":
+                await dialog.accept(prompt_text)
             else:
-                await dialog.dismiss()
-
-        page.on("dialog", lambda dialog: asyncio.create_task(handle_dialog(dialog)))
+                await dialog.accept()
+        else:
+            await dialog.dismiss()
 
-        return f"Set up handler to {action} dialog"
+    browser_manager.set_dialog_handler(page, handle_dialog)
 
-    except Exception as e:
-        error_msg = f"Failed to handle dialog: {str(e)}"
-        return error_msg
+    return f"Set up handler to {action} dialog"
 
 
 # ============================================================================
@@ -1388,6 +1664,7 @@ async def handle_dialog(action: str, prompt_text: Optional[str] = None) -> str:
 
 
 @mcp.tool()
+@tool_errors("go back")
 async def go_back() -> str:
     """
     Navigates to the previous page in browser history.
@@ -1404,19 +1681,15 @@ async def go_back() -> str:
     Raises:
         Exception: If there is no previous page or navigation fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
-        await page.go_back()
-
-        new_url = page.url
-        return f"Navigated back to: {new_url}"
+    page = browser_manager.current_page
+    await page.go_back()
 
-    except Exception as e:
-        error_msg = f"Failed to go back: {str(e)}"
-        return error_msg
+    new_url = page.url
+    return f"Navigated back to: {new_url}"
 
 
 @mcp.tool()
+@tool_errors("go forward")
 async def go_forward() -> str:
     """
     Navigates to the next page in browser history.
@@ -1433,28 +1706,29 @@ async def go_forward() -> str:
     Raises:
         Exception: If there is no forward page or navigation fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
-        await page.go_forward()
+    page = browser_manager.current_page
+    await page.go_forward()
 
-        new_url = page.url
-        return f"Navigated forward to: {new_url}"
-
-    except Exception as e:
-        error_msg = f"Failed to go forward: {str(e)}"
-        return error_msg
+    new_url = page.url
+    return f"Navigated forward to: {new_url}"
 
 
 @mcp.tool()
-async def refresh_page(wait_for_network: bool = True) -> str:
+@tool_errors("refresh page")
+async def refresh_page(
+    wait_for_network: bool = True, strict_idle: bool = False
+) -> str:
     """
     Refreshes the current page.
 
     Reloads the current page, optionally waiting for network requests to complete.
 
     Args:
-        wait_for_network (bool): If True, waits for network idle after refresh.
-                                Default is True.
+        wait_for_network (bool): If True, waits for the load event (document and
+                                subresources) after refresh. Default is True.
+        strict_idle (bool): If True, waits for network idle instead of the load
+                           event. Pages with websockets or polling may never go
+                           idle and will hit the timeout. Default is False.
 
     Returns:
         str: Success message, or error message if refresh fails.
@@ -1468,19 +1742,16 @@ async def refresh_page(wait_for_network: bool = True) -> str:
     Raises:
         Exception: If refresh fails.
     """
-    try:
-        page = await browser_manager.get_current_page()
+    page = browser_manager.current_page
 
-        if wait_for_network:
-            await page.reload(wait_until="networkidle")
-        else:
-            await page.reload(wait_until="domcontentloaded")
+    if strict_idle:
+        await page.reload(wait_until="networkidle")
+    elif wait_for_network:
+        await page.reload(wait_until="load")
+    else:
+        await page.reload(wait_until="domcontentloaded")
 
-        return "Page refreshed successfully"
-
-    except Exception as e:
-        error_msg = f"Failed to refresh page: {str(e)}"
-        return error_msg
+    return "Page refreshed successfully"
 
 
 # ============================================================================
@@ -1489,6 +1760,7 @@ async def refresh_page(wait_for_network: bool = True) -> str:
 
 
 @mcp.tool()
+@tool_errors("open new tab")
 async def new_tab(url: Optional[str] = None) -> str:
     """
     Opens a new browser tab.
@@ -1511,22 +1783,16 @@ async def new_tab(url: Optional[str] = None) -> str:
     Raises:
         Exception: If tab creation or navigation fails.
     """
-    try:
-        page_id = await browser_manager.new_page()
+    page_id = await browser_manager.new_page(url)
 
-        if url:
-            page = await browser_manager.get_current_page()
-            await page.goto(url)
-            return f"Opened new tab with ID: {page_id} and navigated to {url}"
+    if url:
+        return f"Opened new tab with ID: {page_id} and navigated to {url}"
 
-        return f"Opened new tab with ID: {page_id}"
-
-    except Exception as e:
-        error_msg = f"Failed to open new tab: {str(e)}"
-        return error_msg
+    return f"Opened new tab with ID: {page_id}"
 
 
 @mcp.tool()
+@tool_errors("switch to tab", "page_id")
 async def switch_tab(page_id: str) -> str:
     """
     Switches to a different browser tab.
@@ -1547,24 +1813,20 @@ async def switch_tab(page_id: str) -> str:
     Raises:
         Exception: If tab ID is invalid or switch fails.
     """
-    try:
-        success = await browser_manager.switch_page(page_id)
+    success = await browser_manager.switch_page(page_id)
 
-        if not success:
-            return f"Error: Tab with ID '{page_id}' not found"
+    if not success:
+        return f"Error: Tab with ID '{page_id}' not found"
 
-        page = await browser_manager.get_current_page()
-        url = page.url
-        title = await page.title()
+    page = browser_manager.current_page
+    url = page.url
+    title = await page.title()
 
-        return f"Switched to tab {page_id}: {url} - {title}"
-
-    except Exception as e:
-        error_msg = f"Failed to switch to tab '{page_id}': {str(e)}"
-        return error_msg
+    return f"Switched to tab {page_id}: {url} - {title}"
 
 
 @mcp.tool()
+@tool_errors("close tab")
 async def close_tab(page_id: Optional[str] = None) -> str:
     """
     Closes a browser tab.
@@ -1587,21 +1849,17 @@ async def close_tab(page_id: Optional[str] = None) -> str:
     Raises:
         Exception: If tab ID is invalid or close fails.
     """
-    try:
-        target_id = page_id or browser_manager._current_page_id
-        success = await browser_manager.close_page(target_id)
+    target_id = page_id or browser_manager._current_page_id
+    success = await browser_manager.close_page(target_id)
 
-        if success:
-            return f"Closed tab: {target_id}"
-        else:
-            return f"Error: Failed to close tab '{target_id}'"
-
-    except Exception as e:
-        error_msg = f"Failed to close tab: {str(e)}"
-        return error_msg
+    if success:
+        return f"Closed tab: {target_id}"
+    else:
+        return f"Error: Failed to close tab '{target_id}'"
 
 
 @mcp.tool()
+@tool_errors("get tabs", on_error=lambda msg: [{"error": msg}])
 async def get_all_tabs() -> List[Dict[str, Any]]:
     """
     Lists all open browser tabs.
@@ -1624,13 +1882,8 @@ async def get_all_tabs() -> List[Dict[str, Any]]:
     Raises:
         Exception: If retrieval fails.
     """
-    try:
-        tabs = await browser_manager.get_all_pages()
-        return tabs
-
-    except Exception as e:
-        error_msg = f"Failed to get tabs: {str(e)}"
-        return [{"error": error_msg}]
+    tabs = await browser_manager.get_all_pages()
+    return tabs
 
 
 # ============================================================================
@@ -1707,8 +1960,8 @@ async def get_request_logs(max_count: int = 50) -> List[Dict[str, Any]]:
     """
     try:
         # Return logs from browser manager
-        logs = browser_manager._request_logs[-max_count:]
-        return logs
+        logs = browser_manager._request_logs
+        return list(itertools.islice(logs, max(0, len(logs) - max_count), None))
 
     except Exception as e:
         error_msg = f"Failed to get request logs: {str(e)}"
@@ -1744,18 +1997,17 @@ async def block_requests(patterns: List[str]) -> str:
     """
     try:
         context = await browser_manager.get_context()
+        blocked = _compile_url_patterns(patterns)
+        if blocked is None:
+            return "Blocked 0 request pattern(s)"
 
         async def block_handler(route):
-            await route.abort()
-
-        await context.route(
-            "**/*",
-            lambda route: asyncio.create_task(
-                block_handler(route)
-                if any(p in route.request.url for p in patterns)
-                else route.continue_()
-            ),
-        )
+            if blocked.search(route.request.url):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", block_handler)
 
         return f"Blocked {len(patterns)} request pattern(s)"
 
@@ -1795,10 +2047,14 @@ async def find_text(search_text: str) -> str:
     try:
         page = await browser_manager.get_current_page()
 
-        # Use page.evaluate to search for text
-        found = await page.evaluate(
-            f"() => document.body.innerText.includes('{search_text}')"
+        # Fetch the rendered text once per DOM state, then search it locally;
+        # innerText leaves out script/style contents and hidden elements
+        page_text = await browser_manager.get_snapshot(
+            page,
+            "visible_text",
+            lambda: page.evaluate("() => document.body.innerText"),
         )
+        found = search_text in page_text
 
         if found:
             return f"Found text '{search_text}' on the page"
@@ -1843,19 +2099,16 @@ async def find_elements_by_text(
         page = await browser_manager.get_current_page()
 
         if exact_match:
-            elements = await page.locator(f"text={text}").all()
+            locator = page.get_by_text(text, exact=True)
         else:
-            elements = await page.locator(f"text={text}").all()
+            locator = page.locator(f"text={text}")
 
-        result = []
-        for i, elem in enumerate(elements):
-            try:
-                tag = await elem.evaluate("e => e.tagName")
-                elem_text = await elem.inner_text()
-
-                result.append({"tag": tag, "text": elem_text, "index": i})
-            except Exception:
-                continue
+        # Extract tag and rendered text of every match in a single round-trip;
+        # like inner_text(), non-HTML elements (e.g. SVG) are skipped
+        result = await locator.evaluate_all(
+            "els => els.flatMap((e, i) => e instanceof HTMLElement"
+            " ? [{tag: e.tagName, text: e.innerText, index: i}] : [])"
+        )
 
         return result
 
@@ -1898,17 +2151,35 @@ async def get_page_structure() -> Dict[str, Any]:
     try:
         page = await browser_manager.get_current_page()
 
-        structure = await page.evaluate(
-            """() => {
-            return {
-                title: document.title,
-                headings: [...document.querySelectorAll('h1, h2, h3, h4, h5, h6')].map(h => h.textContent),
-                link_count: document.querySelectorAll('a').length,
-                form_count: document.querySelectorAll('form').length,
-                image_count: document.querySelectorAll('img').length,
-                button_count: document.querySelectorAll('button').length
-            }
-        }"""
+        structure = await browser_manager.get_snapshot(
+            page,
+            "structure",
+            # Count everything in a single DOM walk
+            lambda: page.evaluate(
+                """() => {
+                const s = {
+                    title: document.title,
+                    headings: [],
+                    link_count: 0,
+                    form_count: 0,
+                    image_count: 0,
+                    button_count: 0
+                };
+                const root = document.body || document.documentElement;
+                const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
+                for (let n = walker.currentNode; n; n = walker.nextNode()) {
+                    const t = n.localName;
+                    if (t === 'a') s.link_count++;
+                    else if (t === 'form') s.form_count++;
+                    else if (t === 'img') s.image_count++;
+                    else if (t === 'button') s.button_count++;
+                    else if (t.length === 2 && t[0] === 'h' && t[1] >= '1' && t[1] <= '6') {
+                        s.headings.push(n.textContent);
+                    }
+                }
+                return s;
+            }"""
+            ),
         )
 
         return structure
@@ -2114,14 +2385,26 @@ async def get_html_source() -> str:
     """
     try:
         page = await browser_manager.get_current_page()
-        html = await page.content()
 
-        # Truncate if too large
+        # Serialize and truncate in the page so only the kept part is transferred
         max_length = 100000
-        if len(html) > max_length:
-            html = html[:max_length] + f"\n... [truncated, total {len(html)} chars]"
 
-        return html
+        return await browser_manager.get_snapshot(
+            page,
+            "html",
+            lambda: page.evaluate(
+                """maxLength => {
+                const doctype = document.doctype
+                    ? new XMLSerializer().serializeToString(document.doctype)
+                    : '';
+                const html = doctype + document.documentElement.outerHTML;
+                if (html.length <= maxLength) return html;
+                return html.slice(0, maxLength) +
+                    `\\n... [truncated, total ${html.length} chars]`;
+            }""",
+                max_length,
+            ),
+        )
 
     except Exception as e:
         error_msg = f"Failed to get HTML source: {str(e)}"
@@ -2152,8 +2435,8 @@ async def wait_for_timeout(milliseconds: int) -> str:
         Exception: If wait fails.
     """
     try:
-        page = await browser_manager.get_current_page()
-        await page.wait_for_timeout(milliseconds)
+        # A plain sleep needs no page, so don't launch or round-trip to the browser
+        await asyncio.sleep(milliseconds / 1000)
 
         return f"Waited for {milliseconds} milliseconds"
 
@@ -1,7 +1,14 @@
 import requests
 import os
+import ast
 import asyncio
-from typing import Dict, Any, Optional
+import hashlib
+import json
+import shutil
+import signal
+import sys
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 from mcp.server.fastmcp import FastMCP
 
 # Configuration for the IPython backend server
@@ -518,17 +525,253 @@ async def smart_session_workflow(
         return f"Error executing workflow '{workflow_type}': {str(e)}"
 
 
+# Interpreter for quick snippets, resolved once so spawning skips the PATH search
+_PYTHON = shutil.which("python3") or sys.executable
+
+# Each worker leads its own process group so retiring it also kills its job
+# children; setpgid is enough for that and, unlike setsid, needs no new session
+_PROCESS_GROUP = (
+    {"process_group": 0} if sys.version_info >= (3, 11) else {"start_new_session": True}
+)
+
+# Driver run by each warm interpreter. Jobs arrive on stdin as "<length>\n<code>";
+# the snippet's fd-level stdout/stderr are captured in temp files and sent back
+# as "<length>\n<json>" on a private copy of the original stdout. Where fork() is
+# available each snippet runs in a forked child, so module state it changes never
+# reaches the next job; elsewhere the driver runs one snippet and then exits.
+_WORKER_SCRIPT = r"""
+import hashlib, json, os, sys, tempfile, traceback
+from collections import OrderedDict
+
+max_output = int(sys.argv[1])
+can_fork = hasattr(os, "fork")
+proto_in = os.fdopen(os.dup(0), "rb")
+proto_out = os.fdopen(os.dup(1), "wb")
+devnull = os.open(os.devnull, os.O_RDWR)
+for fd in (0, 1, 2):
+    os.dup2(devnull, fd)
+compiled = OrderedDict()  # code hash -> code object, most recent last
+
+
+def execute(code):
+    try:
+        exec(code, {"__name__": "__main__"})
+    except SystemExit as e:
+        if e.code is not None and not isinstance(e.code, int):
+            print(e.code, file=sys.stderr)
+    except BaseException as e:
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+while True:
+    header = proto_in.readline()
+    if not header:
+        break
+    data = proto_in.read(int(header))
+    key = hashlib.blake2b(data, digest_size=16).digest()
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        try:
+            code = compiled.get(key)
+            if code is None:
+                code = compile(data.decode(), "<string>", "exec")
+                compiled[key] = code
+                if len(compiled) > 256:
+                    compiled.popitem(last=False)
+            else:
+                compiled.move_to_end(key)
+        except BaseException as e:
+            traceback.print_exception(type(e), e, None)
+            code = None
+        if code is not None and can_fork:
+            pid = os.fork()
+            if pid == 0:
+                sys.argv = ["-c"]
+                execute(code)
+                os._exit(0)
+            os.waitpid(pid, 0)
+        elif code is not None:
+            sys.argv = ["-c"]
+            execute(code)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        result = {"reusable": can_fork}
+        for name, f in (("stdout", out), ("stderr", err)):
+            size = f.seek(0, os.SEEK_END)
+            f.seek(0)
+            text = f.read(max_output).decode(errors="replace")
+            if size > max_output:
+                text += f"\n... (output truncated at {max_output} bytes)"
+            result[name] = text
+    payload = json.dumps(result).encode()
+    proto_out.write(b"%d\n" % len(payload) + payload)
+    proto_out.flush()
+    if not can_fork:
+        break
+"""
+
+
+class _PythonWorkerPool:
+    """Pool of pre-started Python interpreters that run snippets via exec().
+
+    Reusing interpreters skips process and interpreter startup on every call.
+    Each snippet runs in a forked copy of the worker with a fresh namespace, so
+    nothing it imports or modifies is visible to later snippets. At most `size`
+    snippets run at once; a worker is replaced after `max_jobs` snippets.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        max_jobs: int = 50,
+        timeout: float = 30,
+        max_output: int = 1_000_000,
+    ):
+        self.size = size
+        self.max_jobs = max_jobs
+        self.timeout = timeout
+        self.max_output = max_output
+        self.idle: list = []
+        self.slots: Optional[asyncio.Semaphore] = None
+
+    async def _spawn(self) -> Dict[str, Any]:
+        process = await asyncio.create_subprocess_exec(
+            _PYTHON,
+            "-c",
+            _WORKER_SCRIPT,
+            str(self.max_output),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            **_PROCESS_GROUP,
+        )
+        return {"process": process, "jobs": 0}
+
+    def _retire(self, worker: Dict[str, Any]) -> None:
+        process = worker["process"]
+        if process.returncode is not None:
+            return
+        try:
+            if hasattr(os, "killpg"):
+                # The worker leads its own process group, which also holds the
+                # forked child running the snippet
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+
+    async def _exchange(self, process, code: str) -> Dict[str, Any]:
+        data = code.encode()
+        process.stdin.write(b"%d\n" % len(data) + data)
+        await process.stdin.drain()
+        header = await process.stdout.readline()
+        if not header:
+            raise RuntimeError("Python worker exited unexpectedly")
+        return json.loads(await process.stdout.readexactly(int(header)))
+
+    async def run(self, code: str) -> Tuple[str, str]:
+        """Run `code` in a worker and return its (stdout, stderr).
+
+        Each stream is capped at `max_output` bytes. Raises TimeoutError if no
+        worker frees up within `timeout` seconds, or if the snippet runs longer
+        than that, in which case its worker is killed.
+        """
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.size)
+        await asyncio.wait_for(self.slots.acquire(), timeout=self.timeout)
+        try:
+            worker = self.idle.pop() if self.idle else await self._spawn()
+            try:
+                result = await asyncio.wait_for(
+                    self._exchange(worker["process"], code), timeout=self.timeout
+                )
+            except BaseException:
+                self._retire(worker)
+                raise
+
+            worker["jobs"] += 1
+            if result["reusable"] and worker["jobs"] < self.max_jobs:
+                self.idle.append(worker)
+            else:
+                self._retire(worker)
+            return result["stdout"], result["stderr"]
+        finally:
+            self.slots.release()
+
+
+_python_workers = _PythonWorkerPool(size=max(4, os.cpu_count() or 1))
+
+# Outputs of recent side-effect-free snippets, keyed by a hash of the code
+_CODE_CACHE_SIZE = 256
+_code_cache: "OrderedDict[bytes, Tuple[str, str]]" = OrderedDict()
+
+# Snippets may only import these modules to be considered cacheable
+_PURE_MODULES = frozenset(
+    "bisect collections dataclasses decimal enum fractions functools heapq "
+    "itertools json math operator re statistics string textwrap typing".split()
+)
+# Names that reach files, input or the interpreter's own machinery, directly or
+# by indirection (e.g. __builtins__.open, getattr(__builtins__, "open"))
+_IMPURE_NAMES = frozenset(
+    "open input breakpoint exec eval compile getattr setattr delattr globals "
+    "locals vars id hash memoryview".split()
+)
+
+
+def _looks_pure(code: str) -> bool:
+    """Conservatively check that a snippet's output depends only on its code."""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return True  # The syntax error itself is deterministic
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            modules = [node.module or ""] if node.level == 0 else [""]
+        elif isinstance(node, ast.Name):
+            # Any dunder name, such as __builtins__ or __import__, is impure
+            if node.id in _IMPURE_NAMES or node.id.startswith("__"):
+                return False
+            continue
+        elif isinstance(node, ast.Attribute):
+            if node.attr.startswith("__"):
+                return False
+            continue
+        elif isinstance(node, ast.Constant):
+            # Dunder names in strings, e.g. operator.attrgetter("__builtins__")
+            if isinstance(node.value, str) and "__" in node.value:
+                return False
+            continue
+        else:
+            continue
+        if any(module.split(".")[0] not in _PURE_MODULES for module in modules):
+            return False
+    return True
+
+
 @mcp.tool()
-async def run_quick_python_code(code: str) -> str:
+async def run_quick_python_code(code: str, no_cache: bool = False) -> str:
     """
     Execute Python code in a temporary session for quick calculations.
 
     This tool creates a temporary session, executes the code, and returns the result.
     The session is automatically cleaned up after execution. Variables are not
     preserved between calls.
+    Execution is limited to 30 seconds and each output stream to 1 MB.
 
     Args:
         code: The Python code to execute
+        no_cache: If True, always execute the code even if an identical
+            side-effect-free snippet was run recently
 
     Returns:
         Execution result
@@ -541,17 +784,24 @@ async def run_quick_python_code(code: str) -> str:
         print(result)  # Shows: 4.0
     """
     try:
-        proc = await asyncio.create_subprocess_exec(
-            "python3",
-            "-c",
-            code,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, stderr = await proc.communicate()
+        key = hashlib.blake2b(code.encode(), digest_size=16).digest()
+        cacheable = not no_cache and _looks_pure(code)
+
+        if cacheable and key in _code_cache:
+            _code_cache.move_to_end(key)
+            stdout, stderr = _code_cache[key]
+        else:
+            stdout, stderr = await _python_workers.run(code)
+            if cacheable:
+                _code_cache[key] = (stdout, stderr)
+                if len(_code_cache) > _CODE_CACHE_SIZE:
+                    _code_cache.popitem(last=False)
+
         if stderr:
-            return f"Error:\n{stderr.decode()}"
-        return stdout.decode() or "(no output)"
+            return f"Error:\n{stderr}"
+        return stdout or "(no output)"
+    except asyncio.TimeoutError:
+        return f"Error: Execution timed out after {_python_workers.timeout} seconds."
     except Exception as e:
         return f"Exception: {e}"
 
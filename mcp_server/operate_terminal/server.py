@@ -1,23 +1,54 @@
+import asyncio
+import atexit
 import subprocess
 import os
+import functools
+import getpass
+import heapq
+import io
+import itertools
+import errno
 import json
 import platform
+import queue
 import shutil
-import psutil
+import select
+import selectors
 import socket
+import struct
+import threading
 import time
+import uuid
 from shutil import which
 from mcp.server.fastmcp import FastMCP
-from typing import Optional, Dict
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Optional, Dict, Iterator, List, Tuple
 
 mcp = FastMCP("Operate-Terminals")
 
+# Platform facts cannot change while the server is running, so read them once
+_SYSTEM_INFO = {
+    "os": platform.system(),
+    "os_release": platform.release(),
+    "python_version": platform.python_version(),
+    "path_separator": os.pathsep,
+}
+_IS_WINDOWS = _SYSTEM_INFO["os"] == "Windows"
+
+# getpass checks $USER/$LOGNAME first; os.getlogin needs a controlling terminal
+try:
+    _CURRENT_USER = getpass.getuser()
+except (KeyError, OSError):
+    _CURRENT_USER = "unknown"
+
 # ===================================
 # Basic Tools
 # ===================================
 
 @mcp.tool()
-def execute_command(command: str, timeout: int = 30) -> str:
+async def execute_command(command: str, timeout: int = 30) -> str:
     """
     Executes a shell command and returns its stdout and stderr.
 
@@ -29,20 +60,29 @@ def execute_command(command: str, timeout: int = 30) -> str:
         str: Combined output of stdout and stderr, or an error message.
     """
     try:
-        process = subprocess.run(
-            command, shell=True, capture_output=True, text=True, timeout=timeout
+        # Run without blocking the event loop so other tool calls can proceed
+        process = await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return f"Error: Command timed out after {timeout} seconds."
 
         output = []
-        if process.stdout:
-            output.append(f"STDOUT:\n{process.stdout}")
-        if process.stderr:
-            output.append(f"STDERR:\n{process.stderr}")
+        if stdout:
+            output.append(f"STDOUT:\n{stdout.decode(errors='replace')}")
+        if stderr:
+            output.append(f"STDERR:\n{stderr.decode(errors='replace')}")
 
         return "\n".join(output) if output else "Command executed with no output."
 
-    except subprocess.TimeoutExpired:
-        return f"Error: Command timed out after {timeout} seconds."
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -56,23 +96,35 @@ def get_basic_info() -> dict:
         dict: A dictionary containing OS details, current user, and environment variables.
     """
     return {
-        "os": platform.system(),
-        "os_release": platform.release(),
-        "current_user": os.getlogin() if hasattr(os, "getlogin") else "unknown",
+        **_SYSTEM_INFO,
+        "current_user": _CURRENT_USER,
         "current_working_dir": os.getcwd(),
-        "python_version": platform.python_version(),
-        "path_separator": os.pathsep,
     }
 
 
+# Last serialized environment, keyed on a cheap fingerprint of os.environ
+_env_cache: Tuple[Optional[Tuple[int, int]], str] = (None, "")
+
+
 @mcp.tool()
-def get_environments() -> dict:
+def get_environments() -> str:
     """Get current environment variables in the current sessions.
 
     Returns:
-        dict: A dictionary which is equal to `os.environ`
+        str: A JSON object equal to `os.environ`
     """
-    return json.dumps(dict(os.environ), ensure_ascii=False, indent=2)
+    global _env_cache
+
+    key = (len(os.environ), sum(map(hash, os.environ.items())))
+    if _env_cache[0] != key:
+        _env_cache = (key, json.dumps(dict(os.environ), ensure_ascii=False, indent=2))
+    return _env_cache[1]
+
+
+@functools.lru_cache(maxsize=256)
+def _which_cached(command_name: str, path: str) -> Optional[str]:
+    # PATH is part of the key so lookups are redone whenever it changes
+    return which(command_name, path=path)
 
 
 @mcp.tool()
@@ -84,9 +136,7 @@ def check_command_exists(command_name: str) -> str:
     Args:
         command_name (str): The name of the command to check.
     """
-    
-
-    path = which(command_name)
+    path = _which_cached(command_name, os.environ.get("PATH", os.defpath))
     if path:
         return f"Command '{command_name}' is available at: {path}"
     return f"Command '{command_name}' was not found in the system PATH."
@@ -105,32 +155,42 @@ def list_running_processes(filter_name: Optional[str] = None) -> str:
     Args:
         filter_name (str, optional): Only return processes containing this string.
     """
-    try:
-        if platform.system() == "Windows":
-            cmd = "tasklist"
-        else:
-            cmd = "ps aux"
+    import psutil
 
-        result = subprocess.check_output(cmd, shell=True, text=True)
+    try:
+        max_rows = 500
+        needle = filter_name.lower() if filter_name else None
+        rows = []
+
+        # Read the process table directly instead of spawning ps/tasklist
+        for proc in psutil.process_iter(["pid", "name", "cmdline"]):
+            info = proc.info
+            name = info["name"] or ""
+            cmdline = " ".join(info["cmdline"] or ())
+
+            if needle and needle not in name.lower() and needle not in cmdline.lower():
+                continue
+
+            rows.append(f"{info['pid']:>7} {name} {cmdline}")
+            if len(rows) >= max_rows:
+                rows.append("...(truncated)")
+                break
 
-        if filter_name:
-            lines = [
-                line
-                for line in result.split("\n")
-                if filter_name.lower() in line.lower()
-            ]
-            return (
-                "\n".join(lines)
-                if lines
-                else f"No processes found matching: {filter_name}"
-            )
+        if not rows:
+            return f"No processes found matching: {filter_name}"
 
-        return result[:2000] + "\n...(truncated)"
+        return f"{'PID':>7} NAME COMMAND\n" + "\n".join(rows)
     except Exception as e:
         return f"Failed to list processes: {str(e)}"
     
+# Process handles (psutil.Process) kept between calls so cpu_percent can be
+# measured without sleeping; least recently queried handles are dropped first
+_PROCESS_CACHE_SIZE = 256
+_process_cache: "OrderedDict[int, Any]" = OrderedDict()
+
+
 @mcp.tool()
-def get_process_details(pid: int) -> str:
+def get_process_details(pid: int, include_connections: bool = False) -> str:
     """
     Retrieves detailed information about a specific process including resource usage.
 
@@ -140,6 +200,10 @@ def get_process_details(pid: int) -> str:
     Args:
         pid (int): The Process ID (PID) of the target process. Use list_running_processes
                    to find available PIDs.
+        include_connections (bool): Whether to count the process's open network
+                                    connections. This reads the system-wide socket
+                                    tables and can be slow on busy hosts.
+                                    Defaults to False.
 
     Returns:
         str: A formatted string containing detailed process information including:
@@ -148,6 +212,7 @@ def get_process_details(pid: int) -> str:
              - CPU utilization percentage
              - Memory usage (RSS, VMS) and percentage
              - Number of threads
+             - Number of network connections (if requested)
              - Process creation time
              - Command line arguments
              - Or an error message if the process is not found or access is denied.
@@ -156,34 +221,68 @@ def get_process_details(pid: int) -> str:
         >>> get_process_details(1234)
         "Process Details:\\nName: python3\\nPID: 1234\\nStatus: running\\n..."
     """
+    import psutil
+
     try:
-        process = psutil.Process(pid)
+        process = _process_cache.get(pid)
+        first_sample = process is None or not process.is_running()
+
+        if first_sample:
+            process = psutil.Process(pid)
+            # Drop handles of processes that have exited before caching a new one
+            for cached_pid in [
+                p for p, proc in _process_cache.items() if not proc.is_running()
+            ]:
+                del _process_cache[cached_pid]
+            _process_cache[pid] = process
+            while len(_process_cache) > _PROCESS_CACHE_SIZE:
+                _process_cache.popitem(last=False)
+        _process_cache.move_to_end(pid)
+
+        # Fetch all fields in one pass; denied fields come back as None.
+        # cpu_percent is non-blocking, measured since the previous call.
+        attrs = [
+            "name",
+            "status",
+            "create_time",
+            "cpu_percent",
+            "memory_info",
+            "memory_percent",
+            "num_threads",
+            "cmdline",
+        ]
+        if include_connections:
+            attrs.append("net_connections")
+        info = process.as_dict(attrs=attrs)
+
+        required = ("name", "status", "create_time", "memory_info", "num_threads")
+        if any(info[field] is None for field in required):
+            raise psutil.AccessDenied(pid)
 
         # Basic information
-        name = process.name()
-        status = process.status()
+        name = info["name"]
+        status = info["status"]
         create_time = time.strftime(
-            "%Y-%m-%d %H:%M:%S", time.localtime(process.create_time())
+            "%Y-%m-%d %H:%M:%S", time.localtime(info["create_time"])
         )
 
         # CPU and Memory
-        cpu_percent = process.cpu_percent(interval=0.1)
-        memory_info = process.memory_info()
-        memory_percent = process.memory_percent()
+        cpu_percent = info["cpu_percent"]
+        memory_info = info["memory_info"]
+        memory_percent = info["memory_percent"] or 0.0
 
         # Threads and connections
-        num_threads = process.num_threads()
-        try:
-            connections = process.net_connections(kind="inet")
-            num_connections = len(connections)
-        except (psutil.AccessDenied, psutil.NoSuchProcess):
-            num_connections = 0
+        num_threads = info["num_threads"]
+        if include_connections:
+            num_connections = len(info["net_connections"] or ())
+        else:
+            num_connections = "(not requested)"
 
         # Command line
-        try:
-            cmdline = " ".join(process.cmdline())
-        except (psutil.AccessDenied, psutil.NoSuchProcess):
+        if info["cmdline"] is None:
             cmdline = "Access denied or process not found"
+        else:
+            cmdline = " ".join(info["cmdline"])
 
         # Format output
         details = [
@@ -191,7 +290,11 @@ def get_process_details(pid: int) -> str:
             f"  Name: {name}",
             f"  PID: {pid}",
             f"  Status: {status}",
-            f"  CPU Usage: {cpu_percent}%",
+            (
+                "  CPU Usage: n/a (first sample, call again to measure)"
+                if first_sample
+                else f"  CPU Usage: {cpu_percent}%"
+            ),
             f"  Memory Usage: {memory_info.rss / 1024 / 1024:.2f} MB",
             f"  Memory Percentage: {memory_percent:.2f}%",
             f"  Threads: {num_threads}",
@@ -215,8 +318,101 @@ def get_process_details(pid: int) -> str:
 # Network Utilities
 # ===================================
 
+@dataclass(frozen=True)
+class _NetSnapshot:
+    """Network state read from psutil at one point in time."""
+
+    if_addrs: Dict[str, list]
+    if_stats: Dict[str, Any]
+    io_counters: Any
+    connections: list
+    ts: float
+
+
+# Network state is shared between tools and re-read at most once per second
+_NET_SNAPSHOT_TTL = 1.0
+_net_snapshot: Optional[_NetSnapshot] = None
+
+
+def _psutil_net_snapshot() -> _NetSnapshot:
+    """Return the cached network snapshot, re-reading it once it goes stale."""
+    global _net_snapshot
+
+    import psutil
+
+    now = time.monotonic()
+    if _net_snapshot is None or now - _net_snapshot.ts > _NET_SNAPSHOT_TTL:
+        _net_snapshot = _NetSnapshot(
+            if_addrs=psutil.net_if_addrs(),
+            if_stats=psutil.net_if_stats(),
+            io_counters=psutil.net_io_counters(),
+            # Only TCP has ESTABLISHED/LISTEN states, so skip the UDP tables
+            connections=psutil.net_connections(kind="tcp"),
+            ts=now,
+        )
+    return _net_snapshot
+
+
+# Listening sockets as {port: (pid, process name)}, built from the snapshot above
+_listen_cache: Dict[int, Tuple[Optional[int], str]] = {}
+_listen_cache_ts = -1.0
+
+
+def _listening_ports() -> Dict[int, Tuple[Optional[int], str]]:
+    """Return the map of listening ports for the current network snapshot."""
+    global _listen_cache, _listen_cache_ts
+
+    import psutil
+
+    snapshot = _psutil_net_snapshot()
+    if snapshot.ts == _listen_cache_ts:
+        return _listen_cache
+
+    ports: Dict[int, Tuple[Optional[int], str]] = {}
+    for conn in snapshot.connections:
+        if conn.status != psutil.CONN_LISTEN or conn.laddr.port in ports:
+            continue
+        name = "Unknown"
+        if conn.pid is not None:
+            try:
+                name = psutil.Process(conn.pid).name()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        ports[conn.laddr.port] = (conn.pid, name)
+
+    _listen_cache, _listen_cache_ts = ports, snapshot.ts
+    return ports
+
+
+def _probe_port(host: str, port: int, timeout: float) -> int:
+    """Try a TCP connect and return 0 if it succeeds, else the socket errno."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # Reset on close instead of lingering in TIME_WAIT, so large scans
+        # don't run out of local ports
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+
+        # Non-blocking connect so a refused port answers immediately and a
+        # filtered one costs at most `timeout`
+        s.setblocking(False)
+        try:
+            s.connect((host, port))
+            return 0
+        except BlockingIOError:
+            pass
+        except socket.gaierror:
+            raise
+        except OSError as e:
+            return e.errno or errno.ECONNREFUSED
+
+        _, writable, failed = select.select([], [s], [s], timeout)
+        if not writable and not failed:
+            return errno.ETIMEDOUT
+        return s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+
+
 @mcp.tool()
-def check_port(port: int, host: str = "localhost") -> str:
+def check_port(port: int, host: str = "localhost", timeout: float = 0.25) -> str:
     """
     Checks if a specific network port is currently in use or available.
 
@@ -233,6 +429,8 @@ def check_port(port: int, host: str = "localhost") -> str:
                     - 5000-9000: Various application servers
         host (str): The hostname or IP address to check. Defaults to "localhost".
                     Can be an IP address (e.g., "127.0.0.1") or hostname.
+        timeout (float): Seconds to wait for a connection before treating the port
+                         as closed. Defaults to 0.25.
 
     Returns:
         str: A message indicating whether the port is open (in use) or closed (available).
@@ -242,33 +440,25 @@ def check_port(port: int, host: str = "localhost") -> str:
         >>> check_port(3000)
         "Port 3000 is OPEN on localhost. Used by: node"
         >>> check_port(9999)
-        "Port 9999 is CLOSED on localhost. Available for use."
+        "Port 9999 is CLOSED on localhost (Connection refused). Available for use."
     """
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(1)
-            result = s.connect_ex((host, port))
+        result = _probe_port(host, port, timeout)
 
-            if result == 0:
-                # Port is open, try to find the process using it
-                process_name = "Unknown"
-                try:
-                    for conn in psutil.net_connections():
-                        if conn.laddr.port == port and conn.status == "LISTEN":
-                            try:
-                                process = psutil.Process(conn.pid)
-                                process_name = process.name()
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                pass
-                            break
-                except (psutil.AccessDenied, Exception):
-                    pass
+        if result == 0:
+            # Port is open, try to find the process using it
+            process_name = "Unknown"
+            try:
+                process_name = _listening_ports().get(port, (None, "Unknown"))[1]
+            except Exception:
+                pass
 
-                return (
-                    f"Port {port} is OPEN on {host}. Currently in use by: {process_name}"
-                )
-            else:
-                return f"Port {port} is CLOSED on {host}. Available for use."
+            return f"Port {port} is OPEN on {host}. Currently in use by: {process_name}"
+        else:
+            return (
+                f"Port {port} is CLOSED on {host} ({os.strerror(result)}). "
+                "Available for use."
+            )
 
     except socket.gaierror:
         return f"Error: Could not resolve hostname '{host}'."
@@ -276,6 +466,94 @@ def check_port(port: int, host: str = "localhost") -> str:
         return f"Error: Failed to check port {port}: {str(e)}"
 
 
+@mcp.tool()
+def check_ports(ports: List[int], host: str = "localhost", timeout: float = 0.25) -> str:
+    """
+    Checks several network ports on one host concurrently.
+
+    Each port is probed in a worker thread, so scanning many ports takes roughly
+    as long as the slowest probe instead of the sum of all of them.
+
+    Args:
+        ports (list[int]): The port numbers to check (0-65535).
+        host (str): The hostname or IP address to check. Defaults to "localhost".
+        timeout (float): Seconds to wait for each connection before treating the
+                         port as closed. Defaults to 0.25.
+
+    Returns:
+        str: One line per port, in ascending order, marked OPEN (with the process
+             using it, if known) or CLOSED (with the reason), or an error message.
+
+    Example:
+        >>> check_ports([22, 80, 3000])
+        "Port scan of localhost (3 ports):\n  22: OPEN (sshd)\n  80: CLOSED ..."
+    """
+    if not ports:
+        return "Error: No ports specified."
+
+    try:
+        # Resolve once rather than in every worker
+        address = socket.gethostbyname(host)
+    except socket.gaierror:
+        return f"Error: Could not resolve hostname '{host}'."
+
+    def probe(port: int) -> str:
+        # Empty string means open, otherwise the reason the port is closed
+        try:
+            result = _probe_port(address, port, timeout)
+        except Exception as e:
+            return str(e)
+        return os.strerror(result) if result else ""
+
+    results: Dict[int, str] = {}
+    unique_ports = sorted(set(ports))
+    with ThreadPoolExecutor(max_workers=min(64, len(unique_ports))) as pool:
+        futures = {pool.submit(probe, port): port for port in unique_ports}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    listening: Dict[int, Tuple[Optional[int], str]] = {}
+    if any(not reason for reason in results.values()):
+        try:
+            listening = _listening_ports()
+        except Exception:
+            pass
+
+    lines = [f"Port scan of {host} ({len(unique_ports)} ports):"]
+    for port in unique_ports:
+        reason = results[port]
+        if reason:
+            lines.append(f"  {port}: CLOSED ({reason})")
+        else:
+            lines.append(f"  {port}: OPEN ({listening.get(port, (None, 'Unknown'))[1]})")
+    return "\n".join(lines)
+
+
+# Resolved addresses as {host: (family, address, expiry)}
+_DNS_CACHE_TTL = 300.0
+_DNS_CACHE_SIZE = 256
+_dns_cache: Dict[str, Tuple[List[Tuple[int, tuple]], float]] = {}
+
+
+def _resolve(host: str, ttl: float = _DNS_CACHE_TTL) -> List[Tuple[int, tuple]]:
+    """Resolve a hostname to its (address family, sockaddr) list, reusing recent lookups.
+
+    Addresses keep getaddrinfo's order, with duplicates removed.
+    """
+    now = time.monotonic()
+    cached = _dns_cache.get(host)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+
+    infos = socket.getaddrinfo(host, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+    addresses = list(dict.fromkeys((info[0], info[4]) for info in infos))
+    if cached is None and len(_dns_cache) >= _DNS_CACHE_SIZE:
+        # Evict the oldest entry
+        del _dns_cache[next(iter(_dns_cache))]
+    _dns_cache[host] = (addresses, now + ttl)
+    return addresses
+
+
 @mcp.tool()
 def test_connection(host: str, port: Optional[int] = None, timeout: int = 5) -> str:
     """
@@ -314,7 +592,12 @@ def test_connection(host: str, port: Optional[int] = None, timeout: int = 5) ->
 
     # Test DNS resolution
     try:
-        ip_address = socket.gethostbyname(host)
+        addresses = _resolve(host)
+        # Report an IPv4 address when there is one, as gethostbyname did
+        ip_address = next(
+            (sockaddr[0] for family, sockaddr in addresses if family == socket.AF_INET),
+            addresses[0][1][0],
+        )
         results.append(f"DNS Resolution: SUCCESS ({ip_address})")
     except socket.gaierror:
         results.append("DNS Resolution: FAILED - Could not resolve hostname")
@@ -322,24 +605,29 @@ def test_connection(host: str, port: Optional[int] = None, timeout: int = 5) ->
 
     # Test port connection if specified
     if port:
-        try:
-            start_time = time.time()
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(timeout)
-                result = s.connect_ex((host, port))
-                elapsed = time.time() - start_time
-
-                if result == 0:
-                    results.append(f"Connection: SUCCESS (responded in {elapsed:.3f}s)")
-                    results.append(f"Port {port} on {host} is reachable.")
-                else:
-                    results.append(
-                        f"Connection: FAILED - Port {port} is not accessible"
-                    )
-        except socket.timeout:
-            results.append(f"Connection: TIMEOUT after {timeout}s")
-        except Exception as e:
-            results.append(f"Connection: ERROR - {str(e)}")
+        # Try each address in turn, like socket.create_connection, so a service
+        # bound to 127.0.0.1 is found even when "localhost" resolves to ::1 first
+        for family, sockaddr in addresses:
+            try:
+                start_time = time.time()
+                with socket.socket(family, socket.SOCK_STREAM) as s:
+                    s.settimeout(timeout)
+                    result = s.connect_ex((sockaddr[0], port, *sockaddr[2:]))
+                    elapsed = time.time() - start_time
+            except socket.timeout:
+                failure = f"Connection: TIMEOUT after {timeout}s"
+                continue
+            except Exception as e:
+                failure = f"Connection: ERROR - {str(e)}"
+                continue
+
+            if result == 0:
+                results.append(f"Connection: SUCCESS (responded in {elapsed:.3f}s)")
+                results.append(f"Port {port} on {host} is reachable.")
+                break
+            failure = f"Connection: FAILED - Port {port} is not accessible"
+        else:
+            results.append(failure)
     else:
         results.append("Connection: SKIPPED (no port specified)")
 
@@ -361,21 +649,25 @@ def get_network_info() -> str:
              - IP addresses (IPv4 and IPv6) for each interface
              - MAC addresses for each interface
              - Network I/O statistics (bytes sent/received, packets sent/received)
-             - Active TCP/UDP connections summary
+             - Active TCP connections summary
              - Or an error message if information cannot be retrieved.
 
     Example:
         >>> get_network_info()
         "Network Configuration:\\n\\nInterfaces:\\n  lo (127.0.0.1) - UP\\n  ..."
     """
+    import psutil
+
     try:
-        info = ["Network Configuration:\n"]
+        buf = io.StringIO()
+        buf.write("Network Configuration:\n")
+        snapshot = _psutil_net_snapshot()
 
         # Network interfaces
-        interfaces = psutil.net_if_addrs()
-        stats = psutil.net_if_stats()
+        interfaces = snapshot.if_addrs
+        stats = snapshot.if_stats
 
-        info.append("Interfaces:")
+        buf.write("\nInterfaces:")
         for interface_name, addresses in interfaces.items():
             interface_info = f"  {interface_name}: "
 
@@ -400,30 +692,29 @@ def get_network_info() -> str:
             if mac_address:
                 interface_info += f" | MAC: {mac_address}"
 
-            info.append(interface_info)
+            buf.write(f"\n{interface_info}")
 
         # Network I/O statistics
-        info.append("\nNetwork I/O Statistics:")
-        net_io = psutil.net_io_counters()
-        info.append(f"  Bytes Sent: {net_io.bytes_sent:,}")
-        info.append(f"  Bytes Received: {net_io.bytes_recv:,}")
-        info.append(f"  Packets Sent: {net_io.packets_sent:,}")
-        info.append(f"  Packets Received: {net_io.packets_recv:,}")
-        info.append(f"  Errors In: {net_io.errin:,}")
-        info.append(f"  Errors Out: {net_io.errout:,}")
-        info.append(f"  Drops In: {net_io.dropin:,}")
-        info.append(f"  Drops Out: {net_io.dropout:,}")
+        buf.write("\n\nNetwork I/O Statistics:")
+        net_io = snapshot.io_counters
+        buf.write(f"\n  Bytes Sent: {net_io.bytes_sent:,}")
+        buf.write(f"\n  Bytes Received: {net_io.bytes_recv:,}")
+        buf.write(f"\n  Packets Sent: {net_io.packets_sent:,}")
+        buf.write(f"\n  Packets Received: {net_io.packets_recv:,}")
+        buf.write(f"\n  Errors In: {net_io.errin:,}")
+        buf.write(f"\n  Errors Out: {net_io.errout:,}")
+        buf.write(f"\n  Drops In: {net_io.dropin:,}")
+        buf.write(f"\n  Drops Out: {net_io.dropout:,}")
 
         # Connection summary
-        info.append("\nActive Connections:")
-        connections = psutil.net_connections(kind="inet")
-        established = sum(1 for c in connections if c.status == "ESTABLISHED")
-        listen = sum(1 for c in connections if c.status == "LISTEN")
-        info.append(f"  Established: {established}")
-        info.append(f"  Listening: {listen}")
-        info.append(f"  Total: {len(connections)}")
+        buf.write("\n\nActive TCP Connections:")
+        connections = snapshot.connections
+        statuses = Counter(c.status for c in connections)
+        buf.write(f"\n  Established: {statuses[psutil.CONN_ESTABLISHED]}")
+        buf.write(f"\n  Listening: {statuses[psutil.CONN_LISTEN]}")
+        buf.write(f"\n  Total: {len(connections)}")
 
-        return "\n".join(info)
+        return buf.getvalue()
 
     except psutil.AccessDenied:
         return "Error: Access denied. Try running with elevated privileges."
@@ -436,6 +727,34 @@ def get_network_info() -> str:
 # ===================================
 
 
+@functools.cache
+def _cpu_static_info() -> Tuple[
+    Optional[int], Optional[int], Optional[float], Optional[float]
+]:
+    """Core counts and frequency limits, which are fixed for the process lifetime."""
+    import psutil
+
+    try:
+        freq = psutil.cpu_freq()
+        freq_min, freq_max = (freq.min, freq.max) if freq else (None, None)
+    except Exception:
+        freq_min = freq_max = None  # CPU frequency not available on all platforms
+    return (
+        psutil.cpu_count(logical=False),
+        psutil.cpu_count(logical=True),
+        freq_min,
+        freq_max,
+    )
+
+# Usage bars for every 5% step, indexed by percent // 5
+_BAR_TABLE = ["█" * i + "░" * (20 - i) for i in range(21)]
+
+
+def _bar(percent: float) -> str:
+    """Return the 20-character usage bar for a percentage."""
+    return _BAR_TABLE[min(20, max(0, int(percent / 5)))]
+
+
 @mcp.tool()
 def get_disk_usage(path: str = "/") -> str:
     """
@@ -466,6 +785,8 @@ def get_disk_usage(path: str = "/") -> str:
         >>> get_disk_usage("C:\\\\")
         "Disk Usage for C:\\:\\n  Total: 1.0 TB\\n  Used: 600.2 GB (60%)\\n  ..."
     """
+    import psutil
+
     try:
         usage = psutil.disk_usage(path)
 
@@ -475,17 +796,12 @@ def get_disk_usage(path: str = "/") -> str:
         free_gb = usage.free / (1024**3)
         percent = usage.percent
 
-        # Create visual bar
-        bar_length = 20
-        filled = int(bar_length * percent / 100)
-        bar = "█" * filled + "░" * (bar_length - filled)
-
         info = [
             f"Disk Usage for {path}:",
             f"  Total: {total_gb:.2f} GB",
             f"  Used: {used_gb:.2f} GB ({percent}%)",
             f"  Free: {free_gb:.2f} GB",
-            f"  Usage: [{bar}]",
+            f"  Usage: [{_bar(percent)}]",
         ]
 
         return "\n".join(info)
@@ -521,32 +837,32 @@ def get_memory_usage() -> str:
         >>> get_memory_usage()
         "Memory Usage:\\n  Physical Memory:\\n    Total: 16.0 GB\\n    ..."
     """
+    import psutil
+
     try:
-        info = ["Memory Usage:\n"]
+        buf = io.StringIO()
+        buf.write("Memory Usage:\n")
 
         # Physical memory (RAM)
         mem = psutil.virtual_memory()
-        info.append("Physical Memory (RAM):")
-        info.append(f"  Total: {mem.total / (1024**3):.2f} GB")
-        info.append(f"  Available: {mem.available / (1024**3):.2f} GB")
-        info.append(f"  Used: {mem.used / (1024**3):.2f} GB ({mem.percent}%)")
-        info.append(f"  Free: {mem.free / (1024**3):.2f} GB")
+        buf.write("\nPhysical Memory (RAM):")
+        buf.write(f"\n  Total: {mem.total / (1024**3):.2f} GB")
+        buf.write(f"\n  Available: {mem.available / (1024**3):.2f} GB")
+        buf.write(f"\n  Used: {mem.used / (1024**3):.2f} GB ({mem.percent}%)")
+        buf.write(f"\n  Free: {mem.free / (1024**3):.2f} GB")
 
         # Visual bar for memory
-        bar_length = 20
-        filled = int(bar_length * mem.percent / 100)
-        bar = "█" * filled + "░" * (bar_length - filled)
-        info.append(f"  Usage: [{bar}]")
+        buf.write(f"\n  Usage: [{_bar(mem.percent)}]")
 
         # Swap memory
         swap = psutil.swap_memory()
-        info.append("\nSwap Memory:")
-        info.append(f"  Total: {swap.total / (1024**3):.2f} GB")
-        info.append(f"  Used: {swap.used / (1024**3):.2f} GB ({swap.percent}%)")
-        info.append(f"  Free: {swap.free / (1024**3):.2f} GB")
+        buf.write("\n\nSwap Memory:")
+        buf.write(f"\n  Total: {swap.total / (1024**3):.2f} GB")
+        buf.write(f"\n  Used: {swap.used / (1024**3):.2f} GB ({swap.percent}%)")
+        buf.write(f"\n  Free: {swap.free / (1024**3):.2f} GB")
 
         # Top 5 memory-consuming processes
-        info.append("\nTop 5 Memory-Consuming Processes:")
+        buf.write("\n\nTop 5 Memory-Consuming Processes:")
         processes = []
         for proc in psutil.process_iter(["pid", "name", "memory_percent"]):
             try:
@@ -554,14 +870,14 @@ def get_memory_usage() -> str:
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
 
-        # Sort by memory usage and get top 5
-        processes.sort(key=lambda p: p["memory_percent"], reverse=True)
-        for i, proc in enumerate(processes[:5], 1):
-            info.append(
-                f"  {i}. PID {proc['pid']:>6} | {proc['name']:<20} | {proc['memory_percent']:.2f}%"
+        # Pick the top 5 by memory usage; denied entries report None
+        top = heapq.nlargest(5, processes, key=lambda p: p["memory_percent"] or 0)
+        for i, proc in enumerate(top, 1):
+            buf.write(
+                f"\n  {i}. PID {proc['pid']:>6} | {proc['name'] or '?':<20} | {proc['memory_percent'] or 0:.2f}%"
             )
 
-        return "\n".join(info)
+        return buf.getvalue()
 
     except Exception as e:
         return f"Error: Failed to get memory usage: {str(e)}"
@@ -600,75 +916,93 @@ def get_cpu_usage(per_cpu: bool = False, interval: float = 0.5) -> str:
         >>> get_cpu_usage(per_cpu=True)
         "CPU Usage (Per Core):\\n  CPU 0: 30.0%\\n  CPU 1: 25.0%\\n  ..."
     """
+    import psutil
+
     try:
-        info = ["CPU Usage:\n"]
+        buf = io.StringIO()
+        buf.write("CPU Usage:\n")
+
+        # Prime per-process CPU counters now so the sampling interval below
+        # also serves as the measurement window for every process
+        processes = []
+        for proc in psutil.process_iter(["pid", "name"]):
+            try:
+                proc.cpu_percent(interval=None)
+                processes.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        sample_start = time.monotonic()
 
         # CPU count
-        physical_cores = psutil.cpu_count(logical=False)
-        logical_cores = psutil.cpu_count(logical=True)
-        info.append(f"CPU Information:")
-        info.append(f"  Physical Cores: {physical_cores}")
-        info.append(f"  Logical Cores: {logical_cores}")
+        physical_cores, logical_cores, freq_min, freq_max = _cpu_static_info()
+        buf.write(f"\nCPU Information:")
+        buf.write(f"\n  Physical Cores: {physical_cores}")
+        buf.write(f"\n  Logical Cores: {logical_cores}")
 
         # CPU usage
         if per_cpu:
             usage_per_cpu = psutil.cpu_percent(interval=interval, percpu=True)
-            info.append("\nPer-Core Usage:")
-            for i, usage in enumerate(usage_per_cpu):
-                bar_length = 20
-                filled = int(bar_length * usage / 100)
-                bar = "█" * filled + "░" * (bar_length - filled)
-                info.append(f"  CPU {i:2d}: {usage:5.1f}% [{bar}]")
+            buf.write("\n\nPer-Core Usage:")
+            buf.write(
+                "".join(
+                    f"\n  CPU {i:2d}: {usage:5.1f}% [{_bar(usage)}]"
+                    for i, usage in enumerate(usage_per_cpu)
+                )
+            )
         else:
             usage = psutil.cpu_percent(interval=interval)
-            info.append(f"\nOverall Usage: {usage}%")
-
-            bar_length = 20
-            filled = int(bar_length * usage / 100)
-            bar = "█" * filled + "░" * (bar_length - filled)
-            info.append(f"  Usage: [{bar}]")
+            buf.write(f"\n\nOverall Usage: {usage}%")
+            buf.write(f"\n  Usage: [{_bar(usage)}]")
 
-        # CPU frequency
-        try:
-            freq = psutil.cpu_freq()
-            if freq:
-                info.append("\nCPU Frequency:")
-                info.append(f"  Current: {freq.current:.2f} MHz")
-                info.append(f"  Min: {freq.min:.2f} MHz")
-                info.append(f"  Max: {freq.max:.2f} MHz")
-        except Exception:
-            pass  # CPU frequency not available on all platforms
+        # CPU frequency (only the current value changes between calls)
+        if freq_max is not None:
+            try:
+                freq = psutil.cpu_freq()
+                if freq:
+                    buf.write("\n\nCPU Frequency:")
+                    buf.write(f"\n  Current: {freq.current:.2f} MHz")
+                    buf.write(f"\n  Min: {freq_min:.2f} MHz")
+                    buf.write(f"\n  Max: {freq_max:.2f} MHz")
+            except Exception:
+                pass
 
         # Load average (Unix/Mac only)
         try:
             if hasattr(os, "getloadavg"):
                 load1, load5, load15 = os.getloadavg()
-                info.append("\nLoad Average:")
-                info.append(f"  1 min:  {load1:.2f}")
-                info.append(f"  5 min:  {load5:.2f}")
-                info.append(f"  15 min: {load15:.2f}")
+                buf.write("\n\nLoad Average:")
+                buf.write(f"\n  1 min:  {load1:.2f}")
+                buf.write(f"\n  5 min:  {load5:.2f}")
+                buf.write(f"\n  15 min: {load15:.2f}")
         except Exception:
             pass  # Load average not available on Windows
 
         # Top 5 CPU-consuming processes
-        info.append("\nTop 5 CPU-Consuming Processes:")
-        processes = []
-        for proc in psutil.process_iter(["pid", "name", "cpu_percent"]):
+        buf.write("\n\nTop 5 CPU-Consuming Processes:")
+
+        # Ensure a minimal measurement window when interval is very short
+        time.sleep(max(0.0, 0.1 - (time.monotonic() - sample_start)))
+        usages = []
+        for proc in processes:
             try:
-                # Get CPU percent with small interval for accuracy
-                proc.cpu_percent(interval=0.1)
-                processes.append(proc.info)
+                usages.append(
+                    {
+                        "pid": proc.info["pid"],
+                        "name": proc.info["name"],
+                        "cpu_percent": proc.cpu_percent(interval=None),
+                    }
+                )
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
 
-        # Sort by CPU usage and get top 5
-        processes.sort(key=lambda p: p["cpu_percent"], reverse=True)
-        for i, proc in enumerate(processes[:5], 1):
-            info.append(
-                f"  {i}. PID {proc['pid']:>6} | {proc['name']:<20} | {proc['cpu_percent']:.2f}%"
+        # Pick the top 5 by CPU usage
+        top = heapq.nlargest(5, usages, key=lambda p: p["cpu_percent"] or 0)
+        for i, proc in enumerate(top, 1):
+            buf.write(
+                f"\n  {i}. PID {proc['pid']:>6} | {proc['name'] or '?':<20} | {proc['cpu_percent']:.2f}%"
             )
 
-        return "\n".join(info)
+        return buf.getvalue()
 
     except Exception as e:
         return f"Error: Failed to get CPU usage: {str(e)}"
@@ -681,6 +1015,170 @@ def get_cpu_usage(per_cpu: bool = False, interval: float = 0.5) -> str:
 # Global dictionary to store active shell sessions
 _shell_sessions: Dict[str, subprocess.Popen] = {}
 
+# End marker of a session's last command if it timed out before printing it;
+# the rest of that command's output is discarded before the next one runs
+_pending_markers: Dict[str, bytes] = {}
+
+# Time (s) given to a timed-out command to finish before the next command;
+# after that its session's shell is restarted
+_PENDING_DRAIN_TIMEOUT = 2.0
+
+# select() does not work on pipes on Windows, so there each session's output
+# is forwarded to a queue by reader threads instead
+_session_chunks: Dict[str, "queue.Queue[Optional[bytes]]"] = {}
+
+# Default shell, probed once at import
+if _IS_WINDOWS:
+    _DEFAULT_SHELL: Optional[str] = "cmd.exe"
+else:
+    _DEFAULT_SHELL = next(
+        (shell for shell in ("/bin/zsh", "/bin/bash", "/bin/sh") if os.path.exists(shell)),
+        None,
+    )
+
+
+def _is_cmd_shell(shell_path: str) -> bool:
+    """Check whether a shell path names cmd.exe."""
+    return os.path.basename(shell_path).lower() in ("cmd", "cmd.exe")
+
+
+def _pump_output(stream, chunks: "queue.Queue[Optional[bytes]]") -> None:
+    """Forward a pipe's output to a queue as it arrives, then None at EOF."""
+    try:
+        for data in iter(lambda: stream.read(65536), b""):
+            chunks.put(data)
+    except (OSError, ValueError):
+        pass
+    chunks.put(None)
+
+
+def _start_shell(session_name: str, args: List[str]) -> subprocess.Popen:
+    """Start a shell process and register it as the given session."""
+    process = subprocess.Popen(
+        args,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=0,  # Raw binary pipes, decoded once per command
+    )
+
+    if _IS_WINDOWS:
+        chunks: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        for stream in (process.stdout, process.stderr):
+            threading.Thread(
+                target=_pump_output, args=(stream, chunks), daemon=True
+            ).start()
+        _session_chunks[session_name] = chunks
+    else:
+        # Output is drained with os.read, so reads must never block
+        os.set_blocking(process.stdout.fileno(), False)
+        os.set_blocking(process.stderr.fileno(), False)
+
+    _shell_sessions[session_name] = process
+    return process
+
+
+def _reset_session(session_name: str, process: subprocess.Popen) -> None:
+    """Kill a session's shell and start a fresh one with the same arguments."""
+    process.kill()
+    process.wait()
+    _drop_session(session_name)
+    _start_shell(session_name, process.args)
+
+
+def _drop_session(session_name: str) -> None:
+    """Forget a session and its per-session state."""
+    _shell_sessions.pop(session_name, None)
+    _pending_markers.pop(session_name, None)
+    _session_chunks.pop(session_name, None)
+
+
+def _end_marker_command(marker: str) -> str:
+    """Shell line printing a newline, then the marker followed by the exit code."""
+    if _IS_WINDOWS:
+        return f"echo.\necho {marker}%ERRORLEVEL%\n"
+    return f"printf '\\n{marker}%s\\n' \"$?\"\n"
+
+
+def _read_until_marker(
+    session_name: str, process: subprocess.Popen, marker: bytes, deadline: float
+) -> Tuple[bytearray, int, int]:
+    """
+    Read a session's stdout and stderr until the line holding `marker` is complete.
+
+    Returns:
+        The bytes read, the offset of the marker and the offset of the newline
+        ending its line; both offsets are -1 if the shell closed its output first.
+
+    Raises:
+        TimeoutError: If the marker line is not complete by `deadline`.
+    """
+    buffer = bytearray()
+    end = line_end = -1
+
+    def marker_line_complete() -> bool:
+        nonlocal end, line_end
+        if end == -1:
+            end = buffer.find(marker)
+        if end != -1:
+            line_end = buffer.find(b"\n", end)
+        return line_end != -1
+
+    chunks = _session_chunks.get(session_name)
+    if chunks is not None:
+        open_streams = 2
+        while open_streams and not marker_line_complete():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            try:
+                data = chunks.get(timeout=remaining)
+            except queue.Empty:
+                raise TimeoutError from None
+            if data is None:
+                open_streams -= 1
+            else:
+                buffer += data
+        # Pick up stderr written just before the marker
+        while True:
+            try:
+                data = chunks.get_nowait()
+            except queue.Empty:
+                break
+            if data is not None:
+                buffer += data
+        marker_line_complete()
+        return buffer, end, line_end
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(process.stdout, selectors.EVENT_READ)
+        selector.register(process.stderr, selectors.EVENT_READ)
+
+        while selector.get_map() and not marker_line_complete():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+
+            for key, _ in selector.select(remaining):
+                try:
+                    data = os.read(key.fd, 65536)
+                except BlockingIOError:
+                    continue
+                if data:
+                    buffer += data
+                else:
+                    selector.unregister(key.fileobj)
+
+        # Pick up stderr written just before the marker
+        for key, _ in selector.select(0):
+            try:
+                buffer += os.read(key.fd, 65536)
+            except BlockingIOError:
+                pass
+
+    marker_line_complete()
+    return buffer, end, line_end
+
 
 @mcp.tool()
 def create_shell_session(session_name: str, shell_path: Optional[str] = None) -> str:
@@ -718,28 +1216,16 @@ def create_shell_session(session_name: str, shell_path: Optional[str] = None) ->
     try:
         # Determine default shell if not specified
         if shell_path is None:
-            if platform.system() == "Windows":
-                shell_path = "cmd.exe"
-            else:
-                # Try common shells
-                for shell in ["/bin/zsh", "/bin/bash", "/bin/sh"]:
-                    if os.path.exists(shell):
-                        shell_path = shell
-                        break
-                if shell_path is None:
-                    return "Error: No suitable shell found. Please specify shell_path explicitly."
-
-        # Create the shell process
-        process = subprocess.Popen(
-            [shell_path],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,  # Line buffered
-        )
+            shell_path = _DEFAULT_SHELL
+            if shell_path is None:
+                return "Error: No suitable shell found. Please specify shell_path explicitly."
+
+        args = [shell_path]
+        if _IS_WINDOWS and _is_cmd_shell(shell_path):
+            # Stop cmd.exe from echoing the prompt and each command it reads
+            args.append("/Q")
 
-        _shell_sessions[session_name] = process
+        process = _start_shell(session_name, args)
 
         return (
             f"Shell session '{session_name}' created successfully.\n"
@@ -770,11 +1256,15 @@ def execute_in_session(session_name: str, command: str, timeout: int = 30) -> st
                       shell command, including pipes, redirects, and multiple
                       commands separated by ; or &&.
         timeout (int): Maximum time to wait for command completion in seconds.
-                      Defaults to 30. Commands that take longer will be terminated.
+                      Defaults to 30. A command that takes longer keeps running;
+                      its remaining output is discarded before the next command.
+                      If it has still not finished by then, the session's shell
+                      is restarted and the next command is not run.
 
     Returns:
-        str: The combined stdout and stderr output from the command, or an error
-             message if:
+        str: The combined stdout and stderr output from the command, followed by
+             "[exit code N]" if the command exited with a non-zero status, or an
+             error message if:
              - Session does not exist
              - Session has terminated
              - Command execution fails
@@ -786,58 +1276,79 @@ def execute_in_session(session_name: str, command: str, timeout: int = 30) -> st
         >>> execute_in_session("my_session", "pwd")
         "/tmp\\n"
     """
-    if session_name not in _shell_sessions:
+    process = _shell_sessions.get(session_name)
+    if process is None:
         return f"Error: Shell session '{session_name}' not found. Use create_shell_session first."
 
-    process = _shell_sessions[session_name]
-
     # Check if process is still running
     if process.poll() is not None:
-        del _shell_sessions[session_name]
+        _drop_session(session_name)
         return f"Error: Shell session '{session_name}' has terminated (PID: {process.pid})."
 
     try:
-        # Send command
-        cmd_with_newline = command + "\n"
-        process.stdin.write(cmd_with_newline)
-        process.stdin.flush()
-
-        # Read output
-        output_lines = []
-        stderr_lines = []
-
-        # Set a timeout for reading output
-        start_time = time.time()
-
-        while True:
-            if time.time() - start_time > timeout:
-                return f"Error: Command timed out after {timeout} seconds."
-
-            # Check if there's data to read
-            if process.stdout.readable():
-                try:
-                    line = process.stdout.readline()
-                    if line:
-                        output_lines.append(line)
-                except:
-                    pass
-
-            # Note: This is a simplified implementation. In a production scenario,
-            # you'd need more sophisticated output detection to know when the
-            # command has finished (e.g., looking for prompt patterns)
-
-            # For simplicity, we'll wait a short time and return what we have
-            time.sleep(0.1)
-
-            # Break after collecting some output or timeout
-            if len(output_lines) > 0 and time.time() - start_time > 0.5:
-                break
-
-        output = "".join(output_lines)
+        # Discard what is left of a previous command that timed out. It gets a
+        # short budget of its own; if it still has not finished (or can never
+        # finish, e.g. an unterminated quote), the shell is replaced
+        pending_marker = _pending_markers.get(session_name)
+        if pending_marker is not None:
+            try:
+                _, _, line_end = _read_until_marker(
+                    session_name,
+                    process,
+                    pending_marker,
+                    time.monotonic() + _PENDING_DRAIN_TIMEOUT,
+                )
+            except TimeoutError:
+                _reset_session(session_name, process)
+                return (
+                    f"Error: The previous command in session '{session_name}' was "
+                    f"still running after timing out, so the session was reset: "
+                    f"its shell was restarted, losing the working directory and "
+                    f"environment. The command was not run; send it again."
+                )
+            if line_end == -1:
+                _drop_session(session_name)
+                return f"Error: Shell session '{session_name}' has terminated unexpectedly."
+            del _pending_markers[session_name]
+
+        deadline = time.monotonic() + timeout
+
+        # Send the command followed by a unique end marker carrying its exit code,
+        # so we know exactly when its output is complete
+        marker = f"__END_{uuid.uuid4().hex}__"
+        cmd_bytes = f"{command}\n{_end_marker_command(marker)}".encode("utf-8")
+        pending = memoryview(cmd_bytes)
+        while pending:
+            pending = pending[os.write(process.stdin.fileno(), pending) :]
+
+        # Read stdout and stderr as data arrives until the marker line is complete
+        marker_bytes = marker.encode()
+        try:
+            buffer, end, line_end = _read_until_marker(
+                session_name, process, marker_bytes, deadline
+            )
+        except TimeoutError:
+            _pending_markers[session_name] = marker_bytes
+            return f"Error: Command timed out after {timeout} seconds."
+
+        if line_end == -1:
+            _drop_session(session_name)
+            return f"Error: Shell session '{session_name}' has terminated unexpectedly."
+
+        exit_code = buffer[end + len(marker_bytes) : line_end].decode().strip()
+        # Drop the marker line and the newline printed in front of it
+        newline = b"\r\n" if _IS_WINDOWS else b"\n"
+        body = buffer[:end].removesuffix(newline) + buffer[line_end + 1 :]
+        output = body.decode(errors="replace")
+
+        if exit_code not in ("", "0"):
+            if output and not output.endswith("\n"):
+                output += "\n"
+            output += f"[exit code {exit_code}]"
         return output if output else f"Command '{command}' executed (no output captured)."
 
     except BrokenPipeError:
-        del _shell_sessions[session_name]
+        _drop_session(session_name)
         return f"Error: Shell session '{session_name}' has terminated unexpectedly."
     except Exception as e:
         return f"Error: Failed to execute command in session: {str(e)}"
@@ -866,11 +1377,10 @@ def close_session(session_name: str) -> str:
         >>> close_session("my_session")
         "Shell session 'my_session' closed successfully (PID: 12345)."
     """
-    if session_name not in _shell_sessions:
+    process = _shell_sessions.get(session_name)
+    if process is None:
         return f"Error: Shell session '{session_name}' not found."
 
-    process = _shell_sessions[session_name]
-
     try:
         # Terminate the process
         pid = process.pid
@@ -884,13 +1394,13 @@ def close_session(session_name: str) -> str:
             process.kill()
             process.wait()
 
-        del _shell_sessions[session_name]
+        _drop_session(session_name)
 
         return f"Shell session '{session_name}' closed successfully (PID: {pid})."
 
     except Exception as e:
         # Clean up from dictionary even if termination fails
-        del _shell_sessions[session_name]
+        _drop_session(session_name)
         return f"Shell session '{session_name}' closed with warnings: {str(e)}"
 
 
@@ -899,19 +1409,408 @@ def close_session(session_name: str) -> str:
 # ===================================
 
 
+# Resolved once and run by absolute path; see _git_executable()
+_GIT_PATH = shutil.which("git")
+
+# Read-only invocations: no index lock, no pager, no colour, no prompts
+_GIT_OPTIONS = [
+    "--no-optional-locks",
+    "-c",
+    "core.pager=cat",
+    "-c",
+    "color.ui=never",
+]
+_GIT_ENV_OVERRIDES = {
+    "GIT_OPTIONAL_LOCKS": "0",
+    "GIT_TERMINAL_PROMPT": "0",
+    # Same git output whatever the server's locale
+    "LC_ALL": "C",
+}
+
+
+def _git_executable() -> Optional[str]:
+    """Return the git binary, probing PATH again if git was missing at import."""
+    global _GIT_PATH
+    if _GIT_PATH is None:
+        _GIT_PATH = shutil.which("git")
+    return _GIT_PATH
+
+
+def _git_env() -> Dict[str, str]:
+    return {**os.environ, **_GIT_ENV_OVERRIDES}
+
+
+class _GitBatch:
+    """A long-running `git cat-file --batch-check` process for one repository.
+
+    Resolving revisions through it avoids starting a new git process per lookup.
+    """
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self.lock = threading.Lock()
+        self.process: Optional[subprocess.Popen] = None
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Return the object id `rev` points to, or None if it cannot be resolved."""
+        with self.lock:
+            for _ in range(2):
+                if self.process is None or self.process.poll() is not None:
+                    self.process = subprocess.Popen(
+                        [_GIT_PATH, *_GIT_OPTIONS, "cat-file", "--batch-check"],
+                        cwd=self.repo_path,
+                        env=_git_env(),
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                    )
+                try:
+                    self.process.stdin.write(rev.encode() + b"\n")
+                    self.process.stdin.flush()
+                    line = self.process.stdout.readline()
+                except (BrokenPipeError, OSError):
+                    line = b""
+                if line:
+                    break
+                # The helper died (or never started, e.g. not a repository)
+                self.close()
+            else:
+                return None
+
+        # "<oid> <type> <size>" on success, "<rev> missing" otherwise
+        fields = line.split()
+        return fields[0].decode() if len(fields) == 3 else None
+
+    def close(self) -> None:
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=1)
+        except Exception:
+            self.process.kill()
+        self.process = None
+
+
+# Persistent helpers keyed by resolved repository path
+_git_batches: Dict[str, _GitBatch] = {}
+_git_batches_lock = threading.Lock()
+
+
+def _git_batch(repo_path: str) -> _GitBatch:
+    key = os.path.realpath(repo_path)
+    with _git_batches_lock:
+        batch = _git_batches.get(key)
+        if batch is None:
+            batch = _git_batches[key] = _GitBatch(key)
+        return batch
+
+
+@atexit.register
+def _close_git_batches() -> None:
+    for batch in _git_batches.values():
+        with batch.lock:
+            batch.close()
+
+
+# Results of git commands whose output is fully determined by repository metadata
+_GIT_CACHE_TTL = 60.0
+_GIT_CACHE_SIZE = 128
+_git_cache: "OrderedDict[tuple, Tuple[float, str]]" = OrderedDict()
+_git_cache_lock = threading.Lock()
+
+# Real paths already confirmed to be inside a work tree by _is_git_repo()
+_git_repos: set = set()
+
+# Metadata files under .git that branch, ref and index state is read from
+_GIT_METADATA = ("HEAD", "index", "packed-refs", "config")
+
+# Loose ref directories under .git, walked in full since nested refs such as
+# "feature/b" only change the mtime of their own subdirectory
+_GIT_REF_DIRS = ("refs/heads", "refs/remotes")
+
+
+def _ref_tree_stats(path: str) -> List[tuple]:
+    """(name, mtime, size) of every entry below a ref directory, nested per subdirectory."""
+    stats = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                st = entry.stat(follow_symlinks=False)
+                stats.append((entry.name, st.st_mtime_ns, st.st_size))
+                if entry.is_dir(follow_symlinks=False):
+                    stats.append(tuple(_ref_tree_stats(entry.path)))
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return stats
+
+
+def _git_fingerprint(repo_path: str, files: Tuple[str, ...] = ()) -> Optional[tuple]:
+    """Cheap snapshot of repository state, or None if it cannot be taken.
+
+    Combines the HEAD commit with the size and mtime of the git metadata, of
+    every loose ref and of the given working-tree files (relative to repo_path).
+    Blocks on the filesystem and the cat-file helper, so async callers run it
+    in a thread.
+    """
+    git_dir = os.path.join(repo_path, ".git")
+    if not os.path.isdir(git_dir):
+        return None
+
+    stats = []
+    paths = [os.path.join(git_dir, name) for name in _GIT_METADATA]
+    paths += [os.path.join(repo_path, name) for name in files]
+    for path in paths:
+        try:
+            st = os.stat(path)
+            stats.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            stats.append(None)
+    for name in _GIT_REF_DIRS:
+        stats.append(tuple(_ref_tree_stats(os.path.join(git_dir, name))))
+    return (_git_batch(repo_path).resolve("HEAD"), *stats)
+
+
+# Largest diff returned to the caller; git is stopped once this much is read
+_MAX_DIFF_BYTES = 1024 * 1024
+
+
+async def _run_git(
+    repo_path: str, *args: str, timeout: float = 10, max_bytes: Optional[int] = None
+) -> subprocess.CompletedProcess:
+    """Run a git command without blocking the event loop; kill it on timeout.
+
+    With max_bytes, stdout is read incrementally and git is killed as soon as the
+    limit is reached; the output is cut at the last full line and a note added.
+    """
+    process = await asyncio.create_subprocess_exec(
+        _GIT_PATH,
+        *_GIT_OPTIONS,
+        *args,
+        cwd=repo_path,
+        env=_git_env(),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+    async def read_stdout() -> Tuple[bytes, bool]:
+        if max_bytes is None:
+            return await process.stdout.read(), False
+        buffer = bytearray()
+        while len(buffer) <= max_bytes:
+            chunk = await process.stdout.read(65536)
+            if not chunk:
+                return bytes(buffer), False
+            buffer += chunk
+        process.kill()
+        cut = buffer.rfind(b"\n", 0, max_bytes) + 1 or max_bytes
+        return bytes(buffer[:cut]), True
+
+    try:
+        (stdout, truncated), stderr = await asyncio.wait_for(
+            asyncio.gather(read_stdout(), process.stderr.read()), timeout=timeout
+        )
+        await process.wait()
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()
+        raise
+
+    output = stdout.decode(errors="replace")
+    if truncated:
+        output += f"\n... (output truncated at {max_bytes} bytes)"
+    return subprocess.CompletedProcess(
+        [_GIT_PATH, *_GIT_OPTIONS, *args],
+        0 if truncated else process.returncode,
+        output,
+        stderr.decode(errors="replace"),
+    )
+
+
+async def _is_git_repo(repo_path: str) -> bool:
+    """Check whether repo_path is inside a Git work tree, caching positive answers."""
+    key = os.path.realpath(repo_path)
+    if key in _git_repos:
+        return True
+    result = await _run_git(repo_path, "rev-parse", "--is-inside-work-tree")
+    if result.returncode == 0 and result.stdout.strip() == "true":
+        _git_repos.add(key)
+        return True
+    return False
+
+
+def _git_cache_get(key: tuple) -> Optional[str]:
+    with _git_cache_lock:
+        entry = _git_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] > _GIT_CACHE_TTL:
+            return None
+        _git_cache.move_to_end(key)
+        return entry[1]
+
+
+def _git_cache_put(key: tuple, value: str) -> None:
+    with _git_cache_lock:
+        _git_cache[key] = (time.monotonic(), value)
+        _git_cache.move_to_end(key)
+        while len(_git_cache) > _GIT_CACHE_SIZE:
+            _git_cache.popitem(last=False)
+
+
+def _git_fsmonitor_options(repo_path: str) -> List[str]:
+    """Config overrides that let git status skip files a monitor saw unchanged.
+
+    Uses git's built-in monitor daemon where it exists (macOS, Windows), else
+    the repository's Watchman hook when Watchman is installed.
+    """
+    options = ["-c", "core.untrackedCache=true"]
+    hook = os.path.join(repo_path, ".git", "hooks", "fsmonitor-watchman")
+    if _IS_WINDOWS or _SYSTEM_INFO["os"] == "Darwin":
+        options += ["-c", "core.fsmonitor=true"]
+    elif shutil.which("watchman") and os.path.isfile(hook):
+        options += ["-c", f"core.fsmonitor={os.path.abspath(hook)}"]
+    return options
+
+
+_GIT_STATUS_LABELS = {
+    "M": "modified:",
+    "T": "typechange:",
+    "A": "new file:",
+    "D": "deleted:",
+    "R": "renamed:",
+    "C": "copied:",
+}
+_GIT_UNMERGED_LABELS = {
+    "DD": "both deleted:",
+    "AU": "added by us:",
+    "UD": "deleted by them:",
+    "UA": "added by them:",
+    "DU": "deleted by us:",
+    "AA": "both added:",
+    "UU": "both modified:",
+}
+
+
+def _render_git_status(raw: str) -> str:
+    """Render ``git status --porcelain=v2 -z --branch`` output like ``git status``."""
+    head = oid = upstream = None
+    ahead = behind = None
+    staged, unstaged, unmerged, untracked = [], [], [], []
+
+    records = raw.split("\0")
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+        kind = record[0]
+        if kind == "#":
+            key, _, value = record[2:].partition(" ")
+            if key == "branch.oid":
+                oid = value
+            elif key == "branch.head":
+                head = value
+            elif key == "branch.upstream":
+                upstream = value
+            elif key == "branch.ab":
+                a, b = value.split()
+                ahead, behind = int(a), -int(b)
+        elif kind in "12":
+            fields = record.split(" ", 8 if kind == "1" else 9)
+            xy, path = fields[1], fields[-1]
+            staged_path = path
+            if kind == "2":
+                # Renames carry the original path in the following record
+                staged_path = f"{records[i]} -> {path}"
+                i += 1
+            if xy[0] != ".":
+                label = _GIT_STATUS_LABELS.get(xy[0], "changed:")
+                staged.append((label, staged_path))
+            if xy[1] != ".":
+                unstaged.append((_GIT_STATUS_LABELS.get(xy[1], "changed:"), path))
+        elif kind == "u":
+            fields = record.split(" ", 10)
+            label = _GIT_UNMERGED_LABELS.get(fields[1], "unmerged:")
+            unmerged.append((label, fields[-1]))
+        elif kind == "?":
+            untracked.append(record[2:])
+
+    # Like git, every block after the first line ends with a blank line
+    lines = []
+    if head == "(detached)":
+        lines.append(f"HEAD detached at {(oid or '')[:7]}")
+    else:
+        lines.append(f"On branch {head}")
+    if oid == "(initial)":
+        lines += ["", "No commits yet", ""]
+    elif upstream is not None:
+        if ahead is None:
+            lines.append(
+                f"Your branch is based on '{upstream}', but the upstream is gone."
+            )
+        elif ahead and behind:
+            lines.append(
+                f"Your branch and '{upstream}' have diverged,\n"
+                f"and have {ahead} and {behind} different commits each, respectively."
+            )
+        elif ahead:
+            s = "s" if ahead > 1 else ""
+            lines.append(f"Your branch is ahead of '{upstream}' by {ahead} commit{s}.")
+        elif behind:
+            s = "s" if behind > 1 else ""
+            lines.append(
+                f"Your branch is behind '{upstream}' by {behind} commit{s}, "
+                "and can be fast-forwarded."
+            )
+        else:
+            lines.append(f"Your branch is up to date with '{upstream}'.")
+        lines.append("")
+
+    for title, entries, width in (
+        ("Changes to be committed:", staged, 12),
+        ("Unmerged paths:", unmerged, 17),
+        ("Changes not staged for commit:", unstaged, 12),
+    ):
+        if entries:
+            lines.append(title)
+            lines += [f"\t{label:<{width}}{path}" for label, path in entries]
+            lines.append("")
+    if untracked:
+        lines.append("Untracked files:")
+        lines += [f"\t{path}" for path in untracked]
+        lines.append("")
+
+    if not (staged or unmerged):
+        if unstaged:
+            lines.append("no changes added to commit")
+        elif untracked:
+            lines.append("nothing added to commit but untracked files present")
+        elif oid == "(initial)":
+            lines.append("nothing to commit")
+        else:
+            lines.append("nothing to commit, working tree clean")
+    return "\n".join(lines) + "\n"
+
+
 @mcp.tool()
-def git_status(repo_path: str = ".") -> str:
+async def git_status(repo_path: str = ".", enable_fsmonitor: bool = False) -> str:
     """
     Retrieves the current Git repository status showing changed and untracked files.
 
-    This function executes 'git status' to display the working tree status,
-    including modified, staged, and untracked files. Useful for quickly
+    This function reads the machine-readable 'git status --porcelain=v2'
+    output and renders the working tree status from it, including modified,
+    staged, and untracked files. Useful for quickly
     checking what has changed in a repository.
 
     Args:
         repo_path (str): Path to the Git repository. Defaults to "." (current directory).
                         Can be an absolute or relative path. The function will
                         change to this directory before running git commands.
+        enable_fsmonitor (bool): If True, let git use a file-system monitor and
+                        the untracked cache so it only inspects files that
+                        changed, which helps on very large repositories.
+                        Applied to this call only; the repository config is
+                        not modified. Defaults to False.
 
     Returns:
         str: The git status output showing:
@@ -930,37 +1829,35 @@ def git_status(repo_path: str = ".") -> str:
     """
     try:
         # Verify git is available
-        if not shutil.which("git"):
+        if _git_executable() is None:
             return "Error: Git is not installed or not in PATH."
 
         # Verify path exists
         if not os.path.exists(repo_path):
             return f"Error: Path '{repo_path}' does not exist."
 
+        if not await _is_git_repo(repo_path):
+            return f"Error: '{repo_path}' is not a Git repository."
+
         # Run git status
-        result = subprocess.run(
-            ["git", "status"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10,
+        options = _git_fsmonitor_options(repo_path) if enable_fsmonitor else []
+        result = await _run_git(
+            repo_path, *options, "status", "--porcelain=v2", "-z", "--branch"
         )
 
         if result.returncode == 0:
-            return result.stdout
-        elif "not a git repository" in result.stderr.lower():
-            return f"Error: '{repo_path}' is not a Git repository."
+            return _render_git_status(result.stdout)
         else:
             return f"Error: {result.stderr.strip()}"
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return "Error: Git command timed out."
     except Exception as e:
         return f"Error: Failed to get git status: {str(e)}"
 
 
 @mcp.tool()
-def git_diff(
+async def git_diff(
     repo_path: str = ".", file_path: Optional[str] = None, staged: bool = False
 ) -> str:
     """
@@ -985,6 +1882,7 @@ def git_diff(
              - Context lines (prefixed with space)
              - File headers with metadata
              - Or a message indicating no changes, or an error.
+             Diffs larger than 1 MiB are cut off with a truncation note.
 
     Example:
         >>> git_diff(".", "src/main.py")
@@ -994,15 +1892,36 @@ def git_diff(
     """
     try:
         # Verify git is available
-        if not shutil.which("git"):
+        if _git_executable() is None:
             return "Error: Git is not installed or not in PATH."
 
         # Verify path exists
         if not os.path.exists(repo_path):
             return f"Error: Path '{repo_path}' does not exist."
 
+        if not await _is_git_repo(repo_path):
+            return f"Error: '{repo_path}' is not a Git repository."
+
+        # Staged diffs and single-file diffs depend only on state we can fingerprint;
+        # a whole-tree unstaged diff would need every tracked file checked
+        cache_key = None
+        if staged or (file_path and os.path.isfile(os.path.join(repo_path, file_path))):
+            files = (file_path,) if file_path and not staged else ()
+            fingerprint = await asyncio.to_thread(_git_fingerprint, repo_path, files)
+            if fingerprint is not None:
+                cache_key = (
+                    "diff",
+                    os.path.realpath(repo_path),
+                    file_path,
+                    staged,
+                    fingerprint,
+                )
+                cached = _git_cache_get(cache_key)
+                if cached is not None:
+                    return cached
+
         # Build git diff command
-        cmd = ["git", "diff"]
+        cmd = ["diff"]
         if staged:
             cmd.append("--staged")
 
@@ -1010,31 +1929,48 @@ def git_diff(
             cmd.append(file_path)
 
         # Run git diff
-        result = subprocess.run(
-            cmd, cwd=repo_path, capture_output=True, text=True, timeout=30
+        result = await _run_git(
+            repo_path, *cmd, timeout=30, max_bytes=_MAX_DIFF_BYTES
         )
 
         if result.returncode == 0:
             if result.stdout.strip():
-                return result.stdout
+                output = result.stdout
+            elif staged:
+                output = "No staged changes to display."
             else:
-                if staged:
-                    return "No staged changes to display."
-                else:
-                    return "No unstaged changes to display."
-        elif "not a git repository" in result.stderr.lower():
-            return f"Error: '{repo_path}' is not a Git repository."
+                output = "No unstaged changes to display."
+            if cache_key is not None:
+                _git_cache_put(cache_key, output)
+            return output
         else:
             return f"Error: {result.stderr.strip()}"
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return "Error: Git command timed out."
     except Exception as e:
         return f"Error: Failed to get git diff: {str(e)}"
 
 
+def _git_remote_lines(config_output: str) -> Iterator[str]:
+    """Yield the "Remotes:" section from `git config --get-regexp` remote URLs."""
+    remotes: Dict[str, Dict[str, List[str]]] = {}
+    for line in config_output.splitlines():
+        key, _, url = line.partition(" ")
+        name, _, kind = key[len("remote.") :].rpartition(".")
+        remotes.setdefault(name, {"url": [], "pushurl": []})[kind].append(url)
+
+    if remotes:
+        yield "\nRemotes:"
+    for name, urls in remotes.items():
+        if urls["url"]:
+            yield f"  {name}\t{urls['url'][0]} (fetch)"
+        for url in urls["pushurl"] or urls["url"]:
+            yield f"  {name}\t{url} (push)"
+
+
 @mcp.tool()
-def git_branch_info(repo_path: str = ".", show_all: bool = False) -> str:
+async def git_branch_info(repo_path: str = ".", show_all: bool = False) -> str:
     """
     Retrieves information about Git branches in the repository.
 
@@ -1064,76 +2000,94 @@ def git_branch_info(repo_path: str = ".", show_all: bool = False) -> str:
     """
     try:
         # Verify git is available
-        if not shutil.which("git"):
+        if _git_executable() is None:
             return "Error: Git is not installed or not in PATH."
 
         # Verify path exists
         if not os.path.exists(repo_path):
             return f"Error: Path '{repo_path}' does not exist."
 
-        info = []
+        if not await _is_git_repo(repo_path):
+            return f"Error: '{repo_path}' is not a Git repository."
 
-        # Get current branch
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        fingerprint = await asyncio.to_thread(_git_fingerprint, repo_path)
+        cache_key = None
+        if fingerprint is not None:
+            cache_key = ("branch", os.path.realpath(repo_path), show_all, fingerprint)
+            cached = _git_cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        # One for-each-ref call lists the branches and marks the current one;
+        # remotes come straight from the config. Both run concurrently.
+        refs = ["refs/heads"]
+        if show_all:
+            refs.append("refs/remotes")  # Show all branches (local and remote)
+
+        queries = [
+            _run_git(
+                repo_path,
+                "for-each-ref",
+                "--format=%(HEAD)%00%(refname)%00%(symref:short)",
+                *refs,
+            )
+        ]
+        if not show_all:
+            queries.append(
+                _run_git(
+                    repo_path, "config", "--get-regexp", r"^remote\..*\.(url|pushurl)$"
+                )
+            )
+        result, *rest = await asyncio.gather(*queries)
+        result_remote = rest[0] if rest else None
 
         if result.returncode == 0:
-            current_branch = result.stdout.strip()
-            info.append(f"Current branch: {current_branch}\n")
-        else:
-            info.append("Current branch: Unable to determine\n")
+            current_branch = ""
+            branches: List[Tuple[bool, str]] = []
+            for line in result.stdout.splitlines():
+                head, refname, symref = line.split("\0")
+                if refname.startswith("refs/heads/"):
+                    name = refname[len("refs/heads/") :]
+                else:
+                    name = "remotes/" + refname[len("refs/remotes/") :]
+                if symref:
+                    name += f" -> {symref}"
 
-        # Get list of branches
-        cmd = ["git", "branch"]
-        if show_all:
-            cmd.append("-a")  # Show all branches (local and remote)
+                if head == "*":
+                    current_branch = name
+                branches.append((head == "*", name))
 
-        result = subprocess.run(
-            cmd, cwd=repo_path, capture_output=True, text=True, timeout=10
-        )
+            if not current_branch:
+                head_oid = _git_batch(repo_path).resolve("HEAD")
+                if head_oid:
+                    branches.insert(0, (True, f"(HEAD detached at {head_oid[:7]})"))
 
-        if result.returncode == 0:
             if show_all:
-                info.append("All Branches (local and remote):")
+                heading = "All Branches (local and remote):"
             else:
-                info.append("Local Branches:")
-
-            for line in result.stdout.split("\n"):
-                if line.strip():
-                    # Format: branches are prefixed with * for current
-                    branch = line.strip()
-                    if branch.startswith("*"):
-                        info.append(f"  {branch} (current)")
-                    else:
-                        info.append(f"  {branch}")
-
-            # Get remote info if available
-            if not show_all:
-                result_remote = subprocess.run(
-                    ["git", "remote", "-v"],
-                    cwd=repo_path,
-                    capture_output=True,
-                    text=True,
-                    timeout=10,
+                heading = "Local Branches:"
+            remotes = ()
+            if result_remote is not None and result_remote.returncode == 0:
+                remotes = _git_remote_lines(result_remote.stdout)
+
+            # Format: the current branch is prefixed with *
+            output = "\n".join(
+                itertools.chain(
+                    (f"Current branch: {current_branch}\n", heading),
+                    (
+                        f"  * {name} (current)" if current else f"  {name}"
+                        for current, name in branches
+                    ),
+                    remotes,
                 )
-
-                if result_remote.returncode == 0 and result_remote.stdout.strip():
-                    info.append("\nRemotes:")
-                    for line in result_remote.stdout.strip().split("\n"):
-                        info.append(f"  {line}")
-
-            return "\n".join(info)
-        elif "not a git repository" in result.stderr.lower():
-            return f"Error: '{repo_path}' is not a Git repository."
+            )
+            if cache_key is not None:
+                _git_cache_put(cache_key, output)
+            return output
         else:
             return f"Error: {result.stderr.strip()}"
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return "Error: Git command timed out."
     except Exception as e:
         return f"Error: Failed to get git branch info: {str(e)}"
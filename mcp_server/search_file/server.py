@@ -7,22 +7,56 @@ The RAG service indexes documents (PDF, TXT, MD, DOCX) and provides
 semantic search capabilities using txtai embeddings.
 """
 
+import asyncio
+import io
 import os
+import time
 import uuid
 import httpx
 import json
 import requests
 import seedir
 
-from typing import Optional
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Optional, Tuple
 from mcp.server.fastmcp import FastMCP
 from utils import get_rag_client
 
-# Initialize FastMCP server
-mcp = FastMCP("Local-RAG-Search")
 PORT = int(os.environ.get("TOOL_BACKEND_RAG_PORT", 39257))
 BASE_URL = f"http://127.0.0.1:{PORT}"
 
+# Shared HTTP client so requests to the RAG service reuse kept-alive connections
+_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get or create the shared RAG service HTTP client."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=16),
+        )
+    return _CLIENT
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Close the shared HTTP client when the server shuts down."""
+    global _CLIENT
+    try:
+        yield
+    finally:
+        if _CLIENT is not None:
+            await _CLIENT.aclose()
+            _CLIENT = None
+
+
+# Initialize FastMCP server
+mcp = FastMCP("Local-RAG-Search", lifespan=_lifespan)
+
 
 async def _rag_get_request(endpoint: str, params: dict = None) -> dict:
     """
@@ -36,14 +70,9 @@ async def _rag_get_request(endpoint: str, params: dict = None) -> dict:
         Response data or error dictionary
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{BASE_URL}{endpoint}",
-                params=params or {},
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await _get_client().get(endpoint, params=params or {})
+        response.raise_for_status()
+        return response.json()
     except httpx.ConnectError:
         return {
             "success": False,
@@ -54,6 +83,120 @@ async def _rag_get_request(endpoint: str, params: dict = None) -> dict:
         return {"success": False, "error": str(e)}
 
 
+# The load directory rarely changes, so a successful answer is reused for a while
+_LOAD_DIR_TTL = 300.0
+_load_dir_cache: Optional[Tuple[float, dict]] = None
+
+# Full file contents as (total_lines, content), keyed by path and local stat info
+_CONTENT_TTL = 60.0
+_CONTENT_CACHE_SIZE = 128
+_content_cache: "OrderedDict[tuple, Tuple[float, int, str]]" = OrderedDict()
+
+
+# Recent semantic search results, keyed by (normalized query, limit, threshold,
+# index version of the RAG client)
+_SEARCH_TTL = 600.0
+_SEARCH_CACHE_SIZE = 1024
+_search_cache: "OrderedDict[tuple, Tuple[float, dict]]" = OrderedDict()
+
+
+# Rendered directory trees, keyed by (path, depth, directory mtime). The mtime only
+# reflects direct children, so the TTL bounds staleness for deeper levels.
+_TREE_TTL = 60.0
+_TREE_CACHE_SIZE = 64
+_tree_cache: "OrderedDict[tuple, Tuple[float, dict]]" = OrderedDict()
+
+
+async def _get_load_dir() -> dict:
+    """Get the /config/load_dir response, cached for _LOAD_DIR_TTL seconds."""
+    global _load_dir_cache
+    now = time.monotonic()
+    if _load_dir_cache is not None and now - _load_dir_cache[0] < _LOAD_DIR_TTL:
+        return _load_dir_cache[1]
+
+    result = await _rag_get_request("/config/load_dir", {})
+    if result.get("success"):
+        _load_dir_cache = (now, result)
+    return result
+
+
+async def _content_cache_key(path: str) -> Optional[tuple]:
+    """Key a file by path, mtime and size so edits invalidate its cached content."""
+    load_dir = (await _get_load_dir()).get("load_dir")
+    if not load_dir:
+        return None
+    try:
+        st = os.stat(os.path.join(load_dir, path))
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def _content_cache_lookup(key: Optional[tuple]) -> Optional[Tuple[int, str]]:
+    """Return a fresh cached (total_lines, content) for key, if there is one."""
+    entry = _content_cache.get(key) if key is not None else None
+    if entry is None or time.monotonic() - entry[0] >= _CONTENT_TTL:
+        return None
+    _content_cache.move_to_end(key)
+    return entry[1], entry[2]
+
+
+async def _get_full_content(path: str) -> dict:
+    """Fetch a whole file from /files/content, reusing a recent copy if unchanged."""
+    key = await _content_cache_key(path)
+    cached = _content_cache_lookup(key)
+    if cached is not None:
+        return {"success": True, "total_lines": cached[0], "content": cached[1]}
+
+    result = await _rag_get_request("/files/content", {"path": path})
+    if result.get("success") and key is not None:
+        total_lines = result.get("total_lines", 0)
+        _content_cache[key] = (time.monotonic(), total_lines, result.get("content", ""))
+        _content_cache.move_to_end(key)
+        if len(_content_cache) > _CONTENT_CACHE_SIZE:
+            _content_cache.popitem(last=False)
+    return result
+
+
+async def _get_line_range(path: str, line_start: int, line_end: Optional[int]) -> dict:
+    """Fetch lines line_start..line_end (clamped to the file) and the file's length.
+
+    A cached whole file is sliced locally. Otherwise the range and the line count
+    are requested concurrently instead of downloading the whole file first.
+    """
+    cached = _content_cache_lookup(await _content_cache_key(path))
+    if cached is not None:
+        total_lines, full_content = cached
+        lines = io.StringIO(full_content).readlines()
+        content = "".join(lines[line_start - 1 : line_end])
+    else:
+        params = {"path": path, "line_start": line_start}
+        if line_end is not None:
+            params["line_end"] = line_end
+        metadata, result = await asyncio.gather(
+            _rag_get_request("/files/metadata", {"path": path}),
+            _rag_get_request("/files/content", params),
+        )
+        if not metadata.get("success"):
+            return metadata
+
+        total_lines = metadata.get("total_lines", 0)
+        if line_start <= total_lines < (line_end or 0):
+            # The service rejects ranges past the end of the file; ask again clamped
+            params["line_end"] = total_lines
+            result = await _rag_get_request("/files/content", params)
+        if line_start <= total_lines and not result.get("success"):
+            return result
+        content = result.get("content", "")
+
+    if line_start > total_lines:
+        return {
+            "success": False,
+            "error": f"Invalid line_start: {line_start}. File has {total_lines} lines.",
+        }
+    return {"success": True, "total_lines": total_lines, "content": content}
+
+
 # semantic search based on RAG
 @mcp.tool()
 async def search_semantic_local(
@@ -128,15 +271,32 @@ async def search_semantic_local(
         - The RAG service must be running before using this tool
         - Documents must be indexed before they can be searched
         - Use utils.local_index_directory or utils.local_index_file to add documents
+        - Results for a repeated query are reused for up to 10 minutes; indexing
+          through this server's RAG client takes effect immediately, while
+          changes made by other processes may take that long to appear
     """
     client = get_rag_client()
 
+    # Repeated questions skip embedding the query and searching the index again;
+    # indexing through this server bumps the version and so bypasses old entries
+    key = (" ".join(query.split()), limit, threshold, client.index_version)
+    entry = _search_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _SEARCH_TTL:
+        _search_cache.move_to_end(key)
+        return entry[1]
+
     # Enhance error message for search
     result = await client.search(query, limit, threshold)
 
-    if not result.get("success") and "Cannot connect" in result.get("error", ""):
-        result["error"] += f" Start it with: python backend/tool_backend/rag_service.py"
+    if not result.get("success"):
+        if "Cannot connect" in result.get("error", ""):
+            result["error"] += f" Start it with: python backend/tool_backend/rag_service.py"
+        return result
 
+    _search_cache[key] = (time.monotonic(), result)
+    _search_cache.move_to_end(key)
+    if len(_search_cache) > _SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
     return result
 
 @mcp.tool()
@@ -256,7 +416,7 @@ async def browse_file_tree(path: Optional[str] = None, depth: Optional[int | str
         - Cannot access files outside load directory
     """
     # First get the load_dir from RAG service
-    config_result = await _rag_get_request("/config/load_dir", {})
+    config_result = await _get_load_dir()
     if not config_result.get("success"):
         return config_result
 
@@ -284,6 +444,12 @@ async def browse_file_tree(path: Optional[str] = None, depth: Optional[int | str
         return {"success": False, "error": f"Path not found: {path}"}
 
     try:
+        key = (full_path, str(depth), os.stat(full_path).st_mtime_ns)
+        entry = _tree_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _TREE_TTL:
+            _tree_cache.move_to_end(key)
+            return {**entry[1], "path": path or "/"}
+
         if depth == "all":
             tree_string = seedir.seedir(
                 full_path, style="lines", printout=False, indent=4
@@ -295,20 +461,21 @@ async def browse_file_tree(path: Optional[str] = None, depth: Optional[int | str
 
         # Count items
         if os.path.isdir(full_path):
-            items = os.listdir(full_path)
-            folder_count = len(
-                [i for i in items if os.path.isdir(os.path.join(full_path, i))]
-            )
-            file_count = len(
-                [i for i in items if os.path.isfile(os.path.join(full_path, i))]
-            )
-            item_count = len(items)
+            # scandir reports entry types from the directory listing, no stat per item
+            item_count = folder_count = file_count = 0
+            with os.scandir(full_path) as entries:
+                for entry in entries:
+                    item_count += 1
+                    if entry.is_dir():
+                        folder_count += 1
+                    elif entry.is_file():
+                        file_count += 1
         else:
             folder_count = 0
             file_count = 1
             item_count = 1
 
-        return {
+        result = {
             "success": True,
             "path": path or "/",
             "tree": tree_string,
@@ -316,6 +483,11 @@ async def browse_file_tree(path: Optional[str] = None, depth: Optional[int | str
             "folder_count": folder_count,
             "file_count": file_count,
         }
+        _tree_cache[key] = (time.monotonic(), result)
+        _tree_cache.move_to_end(key)
+        if len(_tree_cache) > _TREE_CACHE_SIZE:
+            _tree_cache.popitem(last=False)
+        return result
 
     except Exception as e:
         return {
@@ -516,7 +688,7 @@ async def get_file_content(
         - line_start must be >= 1 (returns error if invalid)
         - line_end must be >= line_start (returns error if invalid)
         - If line_end > total_lines: auto-adjusted to total_lines (no error)
-        - If line_start > total_lines: returns error from backend
+        - If line_start > total_lines: returns error
 
     Notes:
         - Line numbers are 1-indexed (first line is 1, not 0)
@@ -537,15 +709,17 @@ async def get_file_content(
             "error": f"Invalid line_end: {line_end}. Must be >= line_start ({line_start}).",
         }
 
-    # First, get file total lines by fetching the full file
-    initial_params = {"path": path}
-    initial_result = await _rag_get_request("/files/content", initial_params)
+    # Fetch the whole file (cached while unchanged) or just the requested range
+    if line_start is None and line_end is None:
+        result = await _get_full_content(path)
+    else:
+        result = await _get_line_range(path, line_start or 1, line_end)
 
-    if not initial_result.get("success"):
-        return initial_result
+    if not result.get("success"):
+        return result
 
-    total_lines = initial_result.get("total_lines", 0)
-    full_content = initial_result.get("content", "")
+    total_lines = result.get("total_lines", 0)
+    content = result.get("content", "")
     original_line_end = line_end
 
     # Pre-adjust line_end if it exceeds total lines
@@ -556,19 +730,6 @@ async def get_file_content(
     actual_start = line_start if line_start is not None else 1
     actual_end = line_end if line_end is not None else total_lines
 
-    # If requesting full file (no line range specified), use cached result
-    if line_start is None and line_end is None:
-        content = full_content
-    else:
-        # Otherwise, make a second request with the specific range
-        params = {"path": path, "line_start": actual_start, "line_end": actual_end}
-        result = await _rag_get_request("/files/content", params)
-
-        if not result.get("success"):
-            return result
-
-        content = result.get("content", "")
-
     # Build line index strings (1-indexed format)
     total_line_index = f"1-{total_lines}"
     selected_line_index = f"{actual_start}-{actual_end}"
@@ -632,23 +793,13 @@ async def get_markdown_structure(path: str):
             "statistics": f"Total lines: {result.get('total_lines', 0)}, Code blocks: {result.get('code_block_count', 0)}",
         }
 
-    # Format headings into human-readable structure
-    structure_lines = []
-
-    for heading in headings:
-        level = heading.get("level", 1)
-        text = heading.get("text", "")
-        line_number = heading.get("line_number", 0)
-
-        # Calculate indentation based on heading level (H1=0, H2=2, H3=4, ...)
-        indent = "  " * (level - 1)
-
-        # Format heading with line number
-        heading_marker = "#" * level
-        formatted_line = f'{indent}{heading_marker} {text} (line {line_number})'
-        structure_lines.append(formatted_line)
-
-    structure_string = "\n".join(structure_lines)
+    # Format headings into human-readable structure: indentation follows the
+    # heading level (H1=0, H2=2, H3=4, ...), followed by the line number
+    structure_string = "\n".join(
+        f'{"  " * (h.get("level", 1) - 1)}{"#" * h.get("level", 1)} '
+        f'{h.get("text", "")} (line {h.get("line_number", 0)})'
+        for h in headings
+    )
 
     # Build statistics summary
     total_lines = result.get("total_lines", 0)
@@ -22,6 +22,9 @@ class RAGClient:
         """
         self.port = port or int(os.environ.get("TOOL_BACKEND_RAG_PORT", 39257))
         self.base_url = f"http://127.0.0.1:{self.port}"
+        # Bumped whenever this client changes the index, so callers caching
+        # search results can tell them apart from ones taken before the change
+        self.index_version = 0
 
     async def _handle_request_error(self, error: Exception, operation: str) -> dict:
         """
@@ -132,6 +135,7 @@ class RAGClient:
                 data = response.json()
 
                 if data.get("status") in ["success", "warning"]:
+                    self.index_version += 1
                     return {
                         "success": True,
                         **data,
@@ -177,6 +181,7 @@ class RAGClient:
                 data = response.json()
 
                 if data.get("status") in ["success", "warning"]:
+                    self.index_version += 1
                     return {
                         "success": True,
                         **data,
@@ -212,6 +217,7 @@ class RAGClient:
                 data = response.json()
 
                 if data.get("status") in ["success", "warning"]:
+                    self.index_version += 1
                     return {
                         "success": True,
                         **data,
@@ -279,6 +285,7 @@ class RAGClient:
                 response = await client.post(f"{self.base_url}/index/load", timeout=60.0)
                 response.raise_for_status()
                 data = response.json()
+                self.index_version += 1
 
                 return {
                     "success": data.get("status") == "success",
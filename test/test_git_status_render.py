@@ -0,0 +1,162 @@
+"""
+Unit tests for rendering `git status --porcelain=v2 -z --branch` output
+
+Each case pairs raw porcelain v2 records with the text printed by
+`git -c advice.statusHints=false status` for the same repository state.
+"""
+
+import pytest
+
+server = pytest.importorskip("mcp_server.operate_terminal.server")
+
+OID = "7db16633a41d2548ef3ed59b35026790852a7aca"
+BLOB_A = "78981922613b2afb6025042ff6bd878ac1994e85"
+BLOB_B = "422c2b7ab3b3c668038da977e4e93a5fc623169c"
+
+
+def _raw(*records: str) -> str:
+    return "".join(record + "\0" for record in records)
+
+
+CASES = {
+    "clean": (
+        _raw(f"# branch.oid {OID}", "# branch.head main"),
+        "On branch main\n"
+        "nothing to commit, working tree clean\n",
+    ),
+    "staged": (
+        _raw(
+            f"# branch.oid {OID}",
+            "# branch.head main",
+            f"1 M. N... 100644 100644 100644 {BLOB_A} {BLOB_B} a",
+        ),
+        "On branch main\n"
+        "Changes to be committed:\n"
+        "\tmodified:   a\n"
+        "\n",
+    ),
+    "renamed": (
+        _raw(
+            f"# branch.oid {OID}",
+            "# branch.head main",
+            f"2 R. N... 100644 100644 100644 {BLOB_A} {BLOB_A} R100 c",
+            "a",
+        ),
+        "On branch main\n"
+        "Changes to be committed:\n"
+        "\trenamed:    a -> c\n"
+        "\n",
+    ),
+    "unstaged": (
+        _raw(
+            f"# branch.oid {OID}",
+            "# branch.head main",
+            f"1 .M N... 100644 100644 100644 {BLOB_A} {BLOB_A} a",
+        ),
+        "On branch main\n"
+        "Changes not staged for commit:\n"
+        "\tmodified:   a\n"
+        "\n"
+        "no changes added to commit\n",
+    ),
+    "untracked": (
+        _raw(f"# branch.oid {OID}", "# branch.head main", "? u"),
+        "On branch main\n"
+        "Untracked files:\n"
+        "\tu\n"
+        "\n"
+        "nothing added to commit but untracked files present\n",
+    ),
+    "staged_unstaged_untracked": (
+        _raw(
+            f"# branch.oid {OID}",
+            "# branch.head main",
+            f"1 MM N... 100644 100644 100644 {BLOB_A} {BLOB_B} a",
+            "? u",
+        ),
+        "On branch main\n"
+        "Changes to be committed:\n"
+        "\tmodified:   a\n"
+        "\n"
+        "Changes not staged for commit:\n"
+        "\tmodified:   a\n"
+        "\n"
+        "Untracked files:\n"
+        "\tu\n"
+        "\n",
+    ),
+    "up_to_date": (
+        _raw(
+            f"# branch.oid {OID}",
+            "# branch.head main",
+            "# branch.upstream origin/main",
+            "# branch.ab +0 -0",
+        ),
+        "On branch main\n"
+        "Your branch is up to date with 'origin/main'.\n"
+        "\n"
+        "nothing to commit, working tree clean\n",
+    ),
+    "ahead": (
+        _raw(
+            f"# branch.oid {OID}",
+            "# branch.head main",
+            "# branch.upstream origin/main",
+            "# branch.ab +2 -0",
+        ),
+        "On branch main\n"
+        "Your branch is ahead of 'origin/main' by 2 commits.\n"
+        "\n"
+        "nothing to commit, working tree clean\n",
+    ),
+    "behind": (
+        _raw(
+            f"# branch.oid {OID}",
+            "# branch.head main",
+            "# branch.upstream origin/main",
+            "# branch.ab +0 -1",
+        ),
+        "On branch main\n"
+        "Your branch is behind 'origin/main' by 1 commit, and can be fast-forwarded.\n"
+        "\n"
+        "nothing to commit, working tree clean\n",
+    ),
+    "diverged": (
+        _raw(
+            f"# branch.oid {OID}",
+            "# branch.head main",
+            "# branch.upstream origin/main",
+            "# branch.ab +1 -1",
+            f"1 M. N... 100644 100644 100644 {BLOB_A} {BLOB_B} a",
+        ),
+        "On branch main\n"
+        "Your branch and 'origin/main' have diverged,\n"
+        "and have 1 and 1 different commits each, respectively.\n"
+        "\n"
+        "Changes to be committed:\n"
+        "\tmodified:   a\n"
+        "\n",
+    ),
+    "detached": (
+        _raw(f"# branch.oid {OID}", "# branch.head (detached)"),
+        "HEAD detached at 7db1663\n"
+        "nothing to commit, working tree clean\n",
+    ),
+    "no_commits": (
+        _raw("# branch.oid (initial)", "# branch.head main", "? a"),
+        "On branch main\n"
+        "\n"
+        "No commits yet\n"
+        "\n"
+        "Untracked files:\n"
+        "\ta\n"
+        "\n"
+        "nothing added to commit but untracked files present\n",
+    ),
+}
+
+
+@pytest.mark.parametrize("raw,expected", CASES.values(), ids=CASES.keys())
+def test_render_git_status_matches_git(raw, expected):
+    """Rendered porcelain v2 output matches `git status` without hints."""
+    assert server._render_git_status(raw) == expected
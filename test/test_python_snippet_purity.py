@@ -0,0 +1,52 @@
+"""
+Unit tests for the purity check that decides which quick snippets are cached
+
+Snippets whose output could depend on anything but their code must never be
+classed as pure, or a cached result would be replayed instead of running them.
+"""
+
+import pytest
+
+server = pytest.importorskip("mcp_server.operate_python.server")
+
+
+PURE = [
+    "print(2 + 2)",
+    "import math\nprint(math.sqrt(16))",
+    "from collections import Counter\nprint(Counter('abca').most_common(1))",
+    "x = [i * i for i in range(5)]\nprint(sum(x))",
+    "print(",
+]
+
+IMPURE = [
+    "print(open('/etc/hostname').read())",
+    "f = open\nprint(f('/etc/hostname').read())",
+    "print(__builtins__.open('/etc/hostname').read())",
+    "print(getattr(__builtins__, 'open')('/etc/hostname').read())",
+    "print(globals()['__builtins__'])",
+    "print(vars())",
+    "print(locals())",
+    "print(eval('1 + 1'))",
+    "exec('print(1)')",
+    "print(compile('1', '<s>', 'eval'))",
+    "print(__import__('os').getcwd())",
+    "import json\nprint(json.__builtins__)",
+    "print(().__class__.__base__.__subclasses__())",
+    "import operator, json\nprint(operator.attrgetter('__builtins__')(json))",
+    "print(hash('a'))",
+    "import os\nprint(os.getcwd())",
+    "import random\nprint(random.random())",
+    "from . import x",
+]
+
+
+@pytest.mark.parametrize("code", PURE)
+def test_looks_pure_accepts_deterministic_snippets(code):
+    """Snippets using only the whitelisted modules are cacheable."""
+    assert server._looks_pure(code)
+
+
+@pytest.mark.parametrize("code", IMPURE)
+def test_looks_pure_rejects_side_effects_and_indirection(code):
+    """Direct or indirect access to I/O and interpreter internals is impure."""
+    assert not server._looks_pure(code)